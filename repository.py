@@ -17,6 +17,11 @@ from ynab.exceptions import ApiException, ConflictException
 logger = logging.getLogger(__name__)
 
 
+def _is_deleted(entity: Any) -> bool:
+    """Check whether a synced entity is a deletion tombstone."""
+    return bool(getattr(entity, "deleted", False))
+
+
 class YNABRepository:
     """Local repository for YNAB data with background differential sync."""
 
@@ -274,7 +279,12 @@ class YNABRepository:
     def _sync_entity(
         self, entity_type: str, sync_func: Callable[[int | None], tuple[list[Any], int]]
     ) -> None:
-        """Generic sync method for any entity type."""
+        """Generic sync method for any entity type.
+
+        Every sync stores a new list rather than mutating the current one in place.
+        The server caches values derived from these lists keyed on their identity, so
+        an in-place change would leave those caches serving stale data.
+        """
         with self._lock:
             current_knowledge = self._server_knowledge.get(entity_type, 0)
             last_knowledge = current_knowledge if current_knowledge > 0 else None
@@ -287,20 +297,22 @@ class YNABRepository:
                 # Apply delta changes
                 self._apply_deltas(entity_type, entities)
             else:
-                # Full refresh
-                self._data[entity_type] = entities
+                # Full refresh, dropping deleted entities just as deltas do
+                self._data[entity_type] = [
+                    entity for entity in entities if not _is_deleted(entity)
+                ]
 
             # Update metadata
             self._server_knowledge[entity_type] = new_knowledge
             self._last_sync = datetime.now()
 
     def _apply_deltas(self, entity_type: str, delta_entities: list[Any]) -> None:
-        """Apply delta changes to an entity list."""
+        """Apply delta changes to an entity list, replacing it with a new list."""
         current_entities = self._data.get(entity_type, [])
         entity_map = {entity.id: entity for entity in current_entities}
 
         for delta_entity in delta_entities:
-            if hasattr(delta_entity, "deleted") and delta_entity.deleted:
+            if _is_deleted(delta_entity):
                 # Remove deleted entity
                 entity_map.pop(delta_entity.id, None)
             else:
@@ -1,8 +1,9 @@
 import logging
 import os
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from datetime import date, datetime
 from decimal import Decimal
+from operator import attrgetter, itemgetter
 from typing import Literal
 
 import ynab
@@ -89,16 +90,76 @@ def _filter_active_items[T](
     exclude_closed: bool = False,
 ) -> list[T]:
     """Filter items to exclude deleted/hidden/closed based on flags."""
-    filtered = []
-    for item in items:
-        if exclude_deleted and getattr(item, "deleted", False):
-            continue
-        if exclude_hidden and getattr(item, "hidden", False):
-            continue
-        if exclude_closed and getattr(item, "closed", False):
-            continue
-        filtered.append(item)
-    return filtered
+    return [
+        item
+        for item in items
+        if not (exclude_deleted and getattr(item, "deleted", False))
+        and not (exclude_hidden and getattr(item, "hidden", False))
+        and not (exclude_closed and getattr(item, "closed", False))
+    ]
+
+
+class _RepositoryDerivedValue[T]:
+    """A value derived from one repository list, reused until that list changes.
+
+    The repository replaces its lists whenever it syncs, so the identity of the source
+    list tells us whether the derived value is still valid. The cached value is shared
+    by every response built from it, so callers must treat it as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._cached: tuple[object, T] | None = None
+
+    def get(self, source: object, build: Callable[[], T]) -> T:
+        """Return the value derived from source, building it only if source changed."""
+        if self._cached is not None and self._cached[0] is source:
+            return self._cached[1]
+
+        derived = build()
+        self._cached = (source, derived)
+        return derived
+
+
+_sorted_active_payees = _RepositoryDerivedValue[tuple[list[Payee], list[str]]]()
+_active_categories = _RepositoryDerivedValue[list[Category]]()
+
+
+def _get_sorted_active_payees() -> tuple[list[Payee], list[str]]:
+    """Get active payees sorted by name along with their lowercased names.
+
+    The payee models and lowercased names are computed once per sync so listing and
+    searching don't have to convert or lowercase every payee on every call.
+    """
+    payees = _repository.get_payees()
+
+    def build() -> tuple[list[Payee], list[str]]:
+        named_payees = sorted(
+            ((payee.name.lower(), payee) for payee in _filter_active_items(payees)),
+            key=itemgetter(0),
+        )
+        return (
+            [Payee.from_ynab(payee) for _, payee in named_payees],
+            [lowercase_name for lowercase_name, _ in named_payees],
+        )
+
+    return _sorted_active_payees.get(payees, build)
+
+
+def _get_active_categories() -> list[Category]:
+    """Get visible categories across all category groups, converted once per sync."""
+    category_groups = _repository.get_category_groups()
+
+    def build() -> list[Category]:
+        all_categories = []
+        for category_group in category_groups:
+            active_categories = _filter_active_items(
+                category_group.categories, exclude_hidden=True
+            )
+            for category in active_categories:
+                all_categories.append(Category.from_ynab(category, category_group.name))
+        return all_categories
+
+    return _active_categories.get(category_groups, build)
 
 
 def _build_category_group_map(
@@ -197,24 +258,11 @@ def list_categories(
     Returns:
         CategoriesResponse with categories list and pagination information
     """
-    category_groups = _repository.get_category_groups()
-
-    all_categories = []
-    for category_group in category_groups:
-        active_categories = _filter_active_items(
-            category_group.categories, exclude_hidden=True
-        )
-        for category in active_categories:
-            all_categories.append(
-                Category.from_ynab(category, category_group.name).model_dump()
-            )
+    all_categories = _get_active_categories()
 
     categories_page, pagination = _paginate_items(all_categories, limit, offset)
 
-    # Convert dict categories back to Category objects
-    category_objects = [Category(**cat_dict) for cat_dict in categories_page]
-
-    return CategoriesResponse(categories=category_objects, pagination=pagination)
+    return CategoriesResponse(categories=categories_page, pagination=pagination)
 
 
 @mcp.tool()
@@ -377,27 +425,31 @@ def list_transactions(
         # Use cached transactions for general queries
         transactions_data = _repository.get_transactions()
 
+    # Convert amount filters to milliunits once rather than per transaction
+    min_milliunits = min_amount * 1000 if min_amount is not None else None
+    max_milliunits = max_amount * 1000 if max_amount is not None else None
+
     active_transactions = _filter_active_items(list(transactions_data))
     all_transactions = []
     for txn in active_transactions:
         # Apply amount filters (check milliunits directly for efficiency)
         if (
-            min_amount is not None
+            min_milliunits is not None
             and txn.amount is not None
-            and txn.amount < (min_amount * 1000)
+            and txn.amount < min_milliunits
         ):
             continue
         if (
-            max_amount is not None
+            max_milliunits is not None
             and txn.amount is not None
-            and txn.amount > (max_amount * 1000)
+            and txn.amount > max_milliunits
         ):
             continue
 
         all_transactions.append(Transaction.from_ynab(txn, _repository))
 
     # Sort by date descending (most recent first)
-    all_transactions.sort(key=lambda t: t.date, reverse=True)
+    all_transactions.sort(key=attrgetter("date"), reverse=True)
 
     transactions_page, pagination = _paginate_items(all_transactions, limit, offset)
 
@@ -427,16 +479,10 @@ def list_payees(
     Returns:
         PayeesResponse with payees list and pagination information
     """
-    # Get payees from repository (syncs automatically if needed)
-    payees = _repository.get_payees()
-
-    active_payees = _filter_active_items(payees)
-    all_payees = [Payee.from_ynab(payee) for payee in active_payees]
+    # Get payees sorted by name for easier browsing (syncs automatically if needed)
+    active_payees, _ = _get_sorted_active_payees()
 
-    # Sort by name for easier browsing
-    all_payees.sort(key=lambda p: p.name.lower())
-
-    payees_page, pagination = _paginate_items(all_payees, limit, offset)
+    payees_page, pagination = _paginate_items(active_payees, limit, offset)
 
     return PayeesResponse(payees=payees_page, pagination=pagination)
 
@@ -459,26 +505,32 @@ def find_payee(
 
     Args:
         name_search: Search term to match against payee names (case-insensitive
-                     substring match). Examples: "amazon", "starbucks", "grocery"
+                     substring match). Examples: "amazon", "starbucks", "grocery".
+                     A blank search returns no payees.
         limit: Maximum number of matching payees to return (default: 10)
 
     Returns:
         PayeesResponse with matching payees and pagination information
     """
-    # Get payees from repository (syncs automatically if needed)
-    payees = _repository.get_payees()
-
-    active_payees = _filter_active_items(payees)
     search_term = name_search.lower().strip()
+    if not search_term:
+        # A blank search matches nothing useful, so don't load or scan payees
+        return PayeesResponse(
+            payees=[],
+            pagination=PaginationInfo(
+                total_count=0, limit=limit, offset=0, has_more=False
+            ),
+        )
+
+    # The cached payees are already sorted by name, so matches come out in name order
+    # without another sort (syncs automatically if needed)
+    active_payees, lowercase_names = _get_sorted_active_payees()
     matching_payees = [
-        Payee.from_ynab(payee)
-        for payee in active_payees
-        if search_term in payee.name.lower()
+        payee
+        for payee, lowercase_name in zip(active_payees, lowercase_names, strict=True)
+        if search_term in lowercase_name
     ]
 
-    # Sort by name for easier browsing
-    matching_payees.sort(key=lambda p: p.name.lower())
-
     # Apply limit (no offset since this is a search, not pagination)
     limited_payees = matching_payees[:limit]
 
@@ -551,6 +603,11 @@ def list_scheduled_transactions(
     """
     scheduled_transactions_data = _repository.get_scheduled_transactions()
     active_scheduled_transactions = _filter_active_items(scheduled_transactions_data)
+
+    # Convert amount filters to milliunits once rather than per transaction
+    min_milliunits = min_amount * 1000 if min_amount is not None else None
+    max_milliunits = max_amount * 1000 if max_amount is not None else None
+
     all_scheduled_transactions = []
     for st in active_scheduled_transactions:
         # Apply filters
@@ -570,15 +627,15 @@ def list_scheduled_transactions(
                 continue
 
         # Apply amount filters (check milliunits directly for efficiency)
-        if min_amount is not None and st.amount < (min_amount * 1000):
+        if min_milliunits is not None and st.amount < min_milliunits:
             continue
-        if max_amount is not None and st.amount > (max_amount * 1000):
+        if max_milliunits is not None and st.amount > max_milliunits:
             continue
 
         all_scheduled_transactions.append(ScheduledTransaction.from_ynab(st))
 
     # Sort by next date ascending (earliest scheduled first)
-    all_scheduled_transactions.sort(key=lambda st: st.date_next)
+    all_scheduled_transactions.sort(key=attrgetter("date_next"))
 
     scheduled_transactions_page, pagination = _paginate_items(
         all_scheduled_transactions, limit, offset
@@ -6,10 +6,13 @@ parsing to reduce boilerplate in test files.
 """
 
 import json
+from operator import itemgetter
 from typing import Any
 
 from mcp.types import TextContent
 
+_pagination_fields = itemgetter("total_count", "limit", "offset", "has_more")
+
 
 def extract_response_data(result: Any) -> dict[str, Any]:
     """Extract JSON data from MCP client response."""
@@ -17,12 +20,9 @@ def extract_response_data(result: Any) -> dict[str, Any]:
     if not hasattr(result, "content"):
         raise TypeError(f"Expected CallToolResult with content, got {type(result)}")
 
-    content = result.content
-    assert len(content) == 1
-    response_data: dict[str, Any] | None = (
-        json.loads(content[0].text) if isinstance(content[0], TextContent) else None
-    )
-    assert response_data is not None
+    (content,) = result.content
+    assert isinstance(content, TextContent)
+    response_data: dict[str, Any] = json.loads(content.text)
     return response_data
 
 
@@ -35,7 +35,4 @@ def assert_pagination_info(
     has_more: bool = False,
 ) -> None:
     """Assert pagination info matches expected values."""
-    assert pagination["total_count"] == total_count
-    assert pagination["limit"] == limit
-    assert pagination["offset"] == offset
-    assert pagination["has_more"] == has_more
+    assert _pagination_fields(pagination) == (total_count, limit, offset, has_more)
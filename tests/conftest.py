@@ -4,61 +4,166 @@ Test fixtures for YNAB MCP Server tests.
 This module contains pytest fixtures for testing without calling the actual YNAB API.
 """
 
-import sys
 from collections.abc import AsyncGenerator, Generator
 from datetime import date
-from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, NonCallableMock, patch
 
 import fastmcp
 import pytest
 import ynab
 from fastmcp.client import Client, FastMCPTransport
 
-# Add parent directory to path to import server module
-sys.path.insert(0, str(Path(__file__).parent.parent))
 import server
+from repository import YNABRepository
 
+# Test modules import these helpers directly, so opt them into assertion rewriting
+pytest.register_assert_rewrite("assertions")
 
-@pytest.fixture
-def mock_environment_variables(monkeypatch: pytest.MonkeyPatch) -> None:
+
+@pytest.fixture(scope="session")
+def mock_environment_variables() -> Generator[None, None, None]:
     """Mock environment variables for testing."""
-    monkeypatch.setenv("YNAB_ACCESS_TOKEN", "test_token_123")
-    monkeypatch.setenv("YNAB_BUDGET", "test_budget_id")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("YNAB_ACCESS_TOKEN", "test_token_123")
+        monkeypatch.setenv("YNAB_BUDGET", "test_budget_id")
+        yield
 
 
 @pytest.fixture
-def ynab_client(mock_environment_variables: None) -> Generator[MagicMock, None, None]:
-    """Mock YNAB client with proper autospec for testing."""
-    mock_client = MagicMock(spec=ynab.ApiClient)
-    mock_client.__enter__.return_value = mock_client
-    mock_client.__exit__.return_value = None
-    yield mock_client
+def mock_repository() -> Generator[NonCallableMock, None, None]:
+    """Mock the repository to prevent API calls during testing.
 
-
-@pytest.fixture
-def mock_repository() -> Generator[MagicMock, None, None]:
-    """Mock the repository to prevent API calls during testing."""
-    with patch("server._repository") as mock_repo:
+    The mock is specced from YNABRepository so tests can't configure or assert against
+    repository methods that don't exist. A plain non-callable Mock is enough since the
+    repository is never called or used with magic methods, and is much cheaper to
+    build than a full autospec.
+    """
+    mock_repo = NonCallableMock(spec=YNABRepository)
+    with patch("server._repository", mock_repo):
         yield mock_repo
 
 
+def replace_ynab_api(monkeypatch: pytest.MonkeyPatch, api_class_name: str) -> Mock:
+    """Replace a ynab API class so that every instance it creates is one shared mock."""
+    mock_api = Mock()
+    monkeypatch.setattr(ynab, api_class_name, lambda *_: mock_api)
+    return mock_api
+
+
 @pytest.fixture
-def categories_api(ynab_client: MagicMock) -> Generator[MagicMock, None, None]:
-    mock_api = Mock(spec=ynab.CategoriesApi)
-    with patch("ynab.CategoriesApi", return_value=mock_api):
-        yield mock_api
+def categories_api(ynab_apis: SimpleNamespace) -> Mock:
+    categories_api: Mock = ynab_apis.categories_api
+    return categories_api
 
 
 @pytest.fixture
+def months_api(ynab_apis: SimpleNamespace) -> Mock:
+    months_api: Mock = ynab_apis.months_api
+    return months_api
+
+
+@pytest.fixture(scope="session")
 async def mcp_client() -> AsyncGenerator[Client[FastMCPTransport], None]:
-    """Mock MCP client with proper autospec for testing."""
+    """MCP client connected to the server, shared by all tests in a session.
+
+    Tools look up the repository at call time, so per-test repository mocks still
+    apply to the shared session.
+    """
     async with fastmcp.Client(server.mcp) as client:
         yield client
 
 
+@pytest.fixture
+def ynab_apis(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the YNAB API client and every API class used by the repository.
+
+    Returns a namespace of pre-wired API mocks so tests only need to set return values.
+    Tests that touch several APIs share this one setup instead of a fixture per API.
+    """
+    api_client = Mock()
+    api_client_class = MagicMock()
+    api_client_class.return_value.__enter__.return_value = api_client
+    monkeypatch.setattr(ynab, "ApiClient", api_client_class)
+
+    return SimpleNamespace(
+        client=api_client,
+        accounts_api=replace_ynab_api(monkeypatch, "AccountsApi"),
+        payees_api=replace_ynab_api(monkeypatch, "PayeesApi"),
+        categories_api=replace_ynab_api(monkeypatch, "CategoriesApi"),
+        transactions_api=replace_ynab_api(monkeypatch, "TransactionsApi"),
+        scheduled_transactions_api=replace_ynab_api(
+            monkeypatch, "ScheduledTransactionsApi"
+        ),
+        months_api=replace_ynab_api(monkeypatch, "MonthsApi"),
+    )
+
+
 # Test data factories
+#
+# Field defaults live in module-level dicts that each factory merges with its keyword
+# arguments, so tests only spell out the fields they care about.
+_ACCOUNT_DEFAULTS: dict[str, Any] = {
+    "note": None,
+    "uncleared_balance": 5_000,
+    "transfer_payee_id": None,
+    "direct_import_linked": False,
+    "direct_import_in_error": False,
+    "last_reconciled_at": None,
+    "debt_original_balance": None,
+    "debt_interest_rates": None,
+    "debt_minimum_payments": None,
+    "debt_escrow_amounts": None,
+}
+
+_PAYEE_DEFAULTS: dict[str, Any] = {
+    "transfer_account_id": None,
+}
+
+_CATEGORY_DEFAULTS: dict[str, Any] = {
+    "category_group_name": None,
+    "original_category_group_id": None,
+    "note": None,
+    "goal_type": None,
+    "goal_needs_whole_amount": None,
+    "goal_day": None,
+    "goal_cadence": None,
+    "goal_cadence_frequency": None,
+    "goal_creation_month": None,
+    "goal_target": None,
+    "goal_target_month": None,
+    "goal_percentage_complete": None,
+    "goal_months_to_budget": None,
+    "goal_under_funded": None,
+    "goal_overall_funded": None,
+    "goal_overall_left": None,
+}
+
+_CATEGORY_GROUP_DEFAULTS: dict[str, Any] = {
+    "hidden": False,
+}
+
+_TRANSACTION_DEFAULTS: dict[str, Any] = {
+    "memo": None,
+    "cleared": ynab.TransactionClearedStatus.CLEARED,
+    "approved": True,
+    "flag_color": None,
+    "account_name": "Test Account",
+    "payee_id": None,
+    "payee_name": None,
+    "category_id": None,
+    "category_name": None,
+    "transfer_account_id": None,
+    "transfer_transaction_id": None,
+    "matched_transaction_id": None,
+    "import_id": None,
+    "import_payee_name": None,
+    "import_payee_name_original": None,
+    "debt_transaction_type": None,
+}
+
+
 def create_ynab_account(
     *,
     id: str = "acc-1",
@@ -77,19 +182,9 @@ def create_ynab_account(
         type=account_type,
         on_budget=on_budget,
         closed=closed,
-        note=kwargs.get("note"),
         balance=balance,
-        cleared_balance=kwargs.get("cleared_balance", balance - 5_000),
-        uncleared_balance=kwargs.get("uncleared_balance", 5_000),
-        transfer_payee_id=kwargs.get("transfer_payee_id"),
-        direct_import_linked=kwargs.get("direct_import_linked", False),
-        direct_import_in_error=kwargs.get("direct_import_in_error", False),
-        last_reconciled_at=kwargs.get("last_reconciled_at"),
-        debt_original_balance=kwargs.get("debt_original_balance"),
-        debt_interest_rates=kwargs.get("debt_interest_rates"),
-        debt_minimum_payments=kwargs.get("debt_minimum_payments"),
-        debt_escrow_amounts=kwargs.get("debt_escrow_amounts"),
         deleted=deleted,
+        **{**_ACCOUNT_DEFAULTS, "cleared_balance": balance - 5_000, **kwargs},
     )
 
 
@@ -104,8 +199,8 @@ def create_ynab_payee(
     return ynab.Payee(
         id=id,
         name=name,
-        transfer_account_id=kwargs.get("transfer_account_id"),
         deleted=deleted,
+        **{**_PAYEE_DEFAULTS, **kwargs},
     )
 
 
@@ -125,28 +220,29 @@ def create_ynab_category(
     return ynab.Category(
         id=id,
         category_group_id=category_group_id,
-        category_group_name=kwargs.get("category_group_name"),
         name=name,
         hidden=hidden,
-        original_category_group_id=kwargs.get("original_category_group_id"),
-        note=kwargs.get("note"),
         budgeted=budgeted,
         activity=activity,
         balance=balance,
-        goal_type=kwargs.get("goal_type"),
-        goal_needs_whole_amount=kwargs.get("goal_needs_whole_amount"),
-        goal_day=kwargs.get("goal_day"),
-        goal_cadence=kwargs.get("goal_cadence"),
-        goal_cadence_frequency=kwargs.get("goal_cadence_frequency"),
-        goal_creation_month=kwargs.get("goal_creation_month"),
-        goal_target=kwargs.get("goal_target"),
-        goal_target_month=kwargs.get("goal_target_month"),
-        goal_percentage_complete=kwargs.get("goal_percentage_complete"),
-        goal_months_to_budget=kwargs.get("goal_months_to_budget"),
-        goal_under_funded=kwargs.get("goal_under_funded"),
-        goal_overall_funded=kwargs.get("goal_overall_funded"),
-        goal_overall_left=kwargs.get("goal_overall_left"),
         deleted=deleted,
+        **{**_CATEGORY_DEFAULTS, **kwargs},
+    )
+
+
+def create_ynab_category_group(
+    *,
+    id: str = "group-1",
+    name: str = "Test Group",
+    deleted: bool = False,
+    **kwargs: Any,
+) -> ynab.CategoryGroupWithCategories:
+    """Create a YNAB CategoryGroupWithCategories for testing with sensible defaults."""
+    return ynab.CategoryGroupWithCategories(
+        id=id,
+        name=name,
+        deleted=deleted,
+        **{**_CATEGORY_GROUP_DEFAULTS, "categories": [], **kwargs},
     )
 
 
@@ -164,23 +260,7 @@ def create_ynab_transaction(
         id=id,
         date=transaction_date,
         amount=amount,
-        memo=kwargs.get("memo"),
-        cleared=kwargs.get("cleared", ynab.TransactionClearedStatus.CLEARED),
-        approved=kwargs.get("approved", True),
-        flag_color=kwargs.get("flag_color"),
         account_id=account_id,
-        account_name=kwargs.get("account_name", "Test Account"),
-        payee_id=kwargs.get("payee_id"),
-        payee_name=kwargs.get("payee_name"),
-        category_id=kwargs.get("category_id"),
-        category_name=kwargs.get("category_name"),
-        transfer_account_id=kwargs.get("transfer_account_id"),
-        transfer_transaction_id=kwargs.get("transfer_transaction_id"),
-        matched_transaction_id=kwargs.get("matched_transaction_id"),
-        import_id=kwargs.get("import_id"),
-        import_payee_name=kwargs.get("import_payee_name"),
-        import_payee_name_original=kwargs.get("import_payee_name_original"),
-        debt_transaction_type=kwargs.get("debt_transaction_type"),
         deleted=deleted,
-        subtransactions=kwargs.get("subtransactions", []),
+        **{**_TRANSACTION_DEFAULTS, "subtransactions": [], **kwargs},
     )
@@ -2,144 +2,155 @@
 Test account-related MCP tools.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import NonCallableMock
 
+import pytest
 import ynab
 from assertions import assert_pagination_info, extract_response_data
 from conftest import create_ynab_account
 from fastmcp.client import Client, FastMCPTransport
 
 
-async def test_list_accounts_success(
-    mock_repository: MagicMock,
+@pytest.mark.parametrize(
+    ("accounts", "expected_accounts"),
+    [
+        pytest.param(
+            [
+                create_ynab_account(
+                    id="acc-1",
+                    name="Checking",
+                    account_type=ynab.AccountType.CHECKING,
+                    note="Main account",
+                ),
+                create_ynab_account(
+                    id="acc-2",
+                    name="Savings",
+                    account_type=ynab.AccountType.SAVINGS,
+                    closed=True,
+                    balance=0,
+                ),
+            ],
+            [("acc-1", "Checking", "checking", True)],
+            id="single_open_filters_closed",
+        ),
+        pytest.param(
+            [
+                create_ynab_account(
+                    id="acc-1",
+                    name="Checking",
+                    account_type=ynab.AccountType.CHECKING,
+                ),
+                create_ynab_account(
+                    id="acc-2",
+                    name="Old Savings",
+                    account_type=ynab.AccountType.SAVINGS,
+                    closed=True,
+                ),
+                create_ynab_account(
+                    id="acc-3",
+                    name="Credit Card",
+                    account_type=ynab.AccountType.CREDITCARD,
+                ),
+            ],
+            [
+                ("acc-1", "Checking", "checking", True),
+                ("acc-3", "Credit Card", "creditCard", True),
+            ],
+            id="mixed_types_filters_closed",
+        ),
+        pytest.param(
+            [
+                create_ynab_account(
+                    id="acc-checking",
+                    name="My Checking",
+                    account_type=ynab.AccountType.CHECKING,
+                ),
+                create_ynab_account(
+                    id="acc-savings",
+                    name="Emergency Fund",
+                    account_type=ynab.AccountType.SAVINGS,
+                ),
+                create_ynab_account(
+                    id="acc-credit",
+                    name="Visa Card",
+                    account_type=ynab.AccountType.CREDITCARD,
+                ),
+                create_ynab_account(
+                    id="acc-investment",
+                    name="401k",
+                    account_type=ynab.AccountType.OTHERASSET,
+                    on_budget=False,  # Typically off-budget
+                ),
+            ],
+            [
+                ("acc-checking", "My Checking", "checking", True),
+                ("acc-savings", "Emergency Fund", "savings", True),
+                ("acc-credit", "Visa Card", "creditCard", True),
+                ("acc-investment", "401k", "otherAsset", False),
+            ],
+            id="all_types_open",
+        ),
+    ],
+)
+async def test_list_accounts(
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
+    accounts: list[ynab.Account],
+    expected_accounts: list[tuple[str, str, str, bool]],
 ) -> None:
-    """Test successful account listing."""
-    open_account = create_ynab_account(
-        id="acc-1",
-        name="Checking",
-        account_type=ynab.AccountType.CHECKING,
-        note="Main account",
-    )
-
-    closed_account = create_ynab_account(
-        id="acc-2",
-        name="Savings",
-        account_type=ynab.AccountType.SAVINGS,
-        closed=True,  # Should be excluded
-        balance=0,
-    )
-
-    # Mock repository to return test accounts
-    mock_repository.get_accounts.return_value = [open_account, closed_account]
+    """Test that list_accounts returns open accounts with their types preserved."""
+    mock_repository.get_accounts.return_value = accounts
 
     result = await mcp_client.call_tool("list_accounts", {})
     response_data = extract_response_data(result)
 
-    # Should only include open account
-    accounts = response_data["accounts"]
-    assert len(accounts) == 1
-    assert accounts[0]["id"] == "acc-1"
-    assert accounts[0]["name"] == "Checking"
-
+    assert [
+        (account["id"], account["name"], account["type"], account["on_budget"])
+        for account in response_data["accounts"]
+    ] == expected_accounts
     assert_pagination_info(
         response_data["pagination"],
-        total_count=1,
+        total_count=len(expected_accounts),
         limit=100,
         has_more=False,
     )
 
 
-async def test_list_accounts_filters_closed_accounts(
-    mock_repository: MagicMock,
-    mcp_client: Client[FastMCPTransport],
-) -> None:
-    """Test that list_accounts automatically excludes closed accounts."""
-    open_checking = create_ynab_account(
-        id="acc-1",
-        name="Checking",
-        account_type=ynab.AccountType.CHECKING,
-        closed=False,
-    )
-
-    closed_savings = create_ynab_account(
-        id="acc-2",
-        name="Old Savings",
-        account_type=ynab.AccountType.SAVINGS,
-        closed=True,
-    )
-
-    open_credit = create_ynab_account(
-        id="acc-3",
-        name="Credit Card",
-        account_type=ynab.AccountType.CREDITCARD,
-        closed=False,
-    )
-
-    mock_repository.get_accounts.return_value = [
-        open_checking,
-        closed_savings,
-        open_credit,
-    ]
-
-    result = await mcp_client.call_tool("list_accounts", {})
-    response_data = extract_response_data(result)
-
-    # Should only include open accounts
-    accounts = response_data["accounts"]
-    assert len(accounts) == 2
-
-    account_names = [acc["name"] for acc in accounts]
-    assert "Checking" in account_names
-    assert "Credit Card" in account_names
-    assert "Old Savings" not in account_names  # Closed account excluded
-
-
+@pytest.mark.parametrize(
+    ("offset", "expected_ids", "expected_has_more"),
+    [
+        (0, ["acc-0", "acc-1"], True),
+        (2, ["acc-2", "acc-3"], True),
+        (4, ["acc-4"], False),
+    ],
+)
 async def test_list_accounts_pagination(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
+    offset: int,
+    expected_ids: list[str],
+    expected_has_more: bool,
 ) -> None:
     """Test account listing with pagination."""
-    accounts = []
-    for i in range(5):
-        accounts.append(
-            create_ynab_account(
-                id=f"acc-{i}",
-                name=f"Account {i}",
-                closed=False,
-            )
-        )
-
-    mock_repository.get_accounts.return_value = accounts
-
-    # Test first page
-    result = await mcp_client.call_tool("list_accounts", {"limit": 2, "offset": 0})
-    response_data = extract_response_data(result)
-
-    assert len(response_data["accounts"]) == 2
-    assert_pagination_info(
-        response_data["pagination"],
-        total_count=5,
-        limit=2,
-        has_more=True,
-    )
+    mock_repository.get_accounts.return_value = [
+        create_ynab_account(id=f"acc-{i}", name=f"Account {i}") for i in range(5)
+    ]
 
-    # Test second page
-    result = await mcp_client.call_tool("list_accounts", {"limit": 2, "offset": 2})
+    result = await mcp_client.call_tool("list_accounts", {"limit": 2, "offset": offset})
     response_data = extract_response_data(result)
 
-    assert len(response_data["accounts"]) == 2
+    assert [account["id"] for account in response_data["accounts"]] == expected_ids
     assert_pagination_info(
         response_data["pagination"],
         total_count=5,
         limit=2,
-        offset=2,
-        has_more=True,
+        offset=offset,
+        has_more=expected_has_more,
     )
 
 
 async def test_list_accounts_with_repository_sync(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test that list_accounts triggers repository sync when needed."""
@@ -159,68 +170,8 @@ async def test_list_accounts_with_repository_sync(
     assert response_data["accounts"][0]["id"] == "acc-1"
 
 
-async def test_list_accounts_account_types(
-    mock_repository: MagicMock,
-    mcp_client: Client[FastMCPTransport],
-) -> None:
-    """Test that different account types are handled correctly."""
-    checking_account = create_ynab_account(
-        id="acc-checking",
-        name="My Checking",
-        account_type=ynab.AccountType.CHECKING,
-        on_budget=True,
-    )
-
-    savings_account = create_ynab_account(
-        id="acc-savings",
-        name="Emergency Fund",
-        account_type=ynab.AccountType.SAVINGS,
-        on_budget=True,
-    )
-
-    credit_card = create_ynab_account(
-        id="acc-credit",
-        name="Visa Card",
-        account_type=ynab.AccountType.CREDITCARD,
-        on_budget=True,
-    )
-
-    investment_account = create_ynab_account(
-        id="acc-investment",
-        name="401k",
-        account_type=ynab.AccountType.OTHERASSET,
-        on_budget=False,  # Typically off-budget
-    )
-
-    mock_repository.get_accounts.return_value = [
-        checking_account,
-        savings_account,
-        credit_card,
-        investment_account,
-    ]
-
-    result = await mcp_client.call_tool("list_accounts", {})
-    response_data = extract_response_data(result)
-
-    # All account types should be included (none are closed)
-    accounts = response_data["accounts"]
-    assert len(accounts) == 4
-
-    # Verify account types are preserved
-    account_types = {acc["id"]: acc["type"] for acc in accounts}
-    assert account_types["acc-checking"] == "checking"
-    assert account_types["acc-savings"] == "savings"
-    assert account_types["acc-credit"] == "creditCard"
-    assert account_types["acc-investment"] == "otherAsset"
-
-    # Verify on_budget status
-    on_budget_status = {acc["id"]: acc["on_budget"] for acc in accounts}
-    assert on_budget_status["acc-checking"] is True
-    assert on_budget_status["acc-investment"] is False
-
-
 async def test_list_accounts_with_debt_fields(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test that debt-related fields are properly included for debt accounts."""
@@ -276,9 +227,10 @@ async def test_list_accounts_with_debt_fields(
 
     accounts = response_data["accounts"]
     assert len(accounts) == 3
+    accounts_by_id = {acc["id"]: acc for acc in accounts}
 
-    # Find mortgage account and verify debt fields
-    mortgage = next(acc for acc in accounts if acc["id"] == "acc-mortgage")
+    # Verify mortgage account debt fields
+    mortgage = accounts_by_id["acc-mortgage"]
     assert mortgage["debt_interest_rates"] == {
         "2024-01-01": "0.03375",  # 3.375% as decimal
         "2024-07-01": "0.0325",  # 3.25% as decimal
@@ -293,13 +245,13 @@ async def test_list_accounts_with_debt_fields(
     }
 
     # Verify credit card has null debt fields (empty dicts become None)
-    credit = next(acc for acc in accounts if acc["id"] == "acc-credit")
+    credit = accounts_by_id["acc-credit"]
     assert credit["debt_interest_rates"] is None
     assert credit["debt_minimum_payments"] is None
     assert credit["debt_escrow_amounts"] is None
 
     # Verify checking account has null debt fields
-    checking = next(acc for acc in accounts if acc["id"] == "acc-checking")
+    checking = accounts_by_id["acc-checking"]
     assert checking["debt_interest_rates"] is None
     assert checking["debt_minimum_payments"] is None
     assert checking["debt_escrow_amounts"] is None
@@ -1,16 +1,19 @@
 """Test assertion helpers."""
 
+from typing import Any
+
 import pytest
 from assertions import extract_response_data
 
 
-def test_extract_response_data_invalid_type() -> None:
-    """Test that extract_response_data raises TypeError for invalid input."""
-    with pytest.raises(TypeError, match="Expected CallToolResult with content"):
-        extract_response_data("invalid_input")
-
-
-def test_extract_response_data_invalid_list() -> None:
-    """Test that extract_response_data raises TypeError for old list format."""
+@pytest.mark.parametrize(
+    "invalid_result",
+    [
+        pytest.param("invalid_input", id="string"),
+        pytest.param([], id="old_list_format"),
+    ],
+)
+def test_extract_response_data_rejects_invalid_result(invalid_result: Any) -> None:
+    """Test that extract_response_data raises TypeError for non-CallToolResult input."""
     with pytest.raises(TypeError, match="Expected CallToolResult with content"):
-        extract_response_data([])
+        extract_response_data(invalid_result)
@@ -2,16 +2,17 @@
 Test category-related MCP tools.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import NonCallableMock, patch
 
-import ynab
 from assertions import assert_pagination_info, extract_response_data
-from conftest import create_ynab_category
+from conftest import create_ynab_category, create_ynab_category_group
 from fastmcp.client import Client, FastMCPTransport
 
+import server
+
 
 async def test_list_categories_success(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test successful category listing."""
     visible_category = create_ynab_category(
@@ -32,12 +33,16 @@ async def test_list_categories_success(
         balance=10_000,
     )
 
-    category_group = ynab.CategoryGroupWithCategories(
+    deleted_category = create_ynab_category(
+        id="cat-deleted",
+        name="Deleted Category",
+        deleted=True,  # Should be excluded
+    )
+
+    category_group = create_ynab_category_group(
         id="group-1",
         name="Monthly Bills",
-        hidden=False,
-        deleted=False,
-        categories=[visible_category, hidden_category],
+        categories=[visible_category, hidden_category, deleted_category],
     )
 
     # Mock repository to return category groups
@@ -46,7 +51,7 @@ async def test_list_categories_success(
     result = await mcp_client.call_tool("list_categories", {})
     response_data = extract_response_data(result)
 
-    # Should only include visible category
+    # Should only include the visible, non-deleted category
     categories = response_data["categories"]
     assert len(categories) == 1
     assert categories[0]["id"] == "cat-1"
@@ -61,43 +66,58 @@ async def test_list_categories_success(
     )
 
 
+async def test_list_categories_reflects_repository_sync(
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
+) -> None:
+    """Test that converted categories are reused until the repository syncs."""
+    mock_repository.get_category_groups.return_value = [
+        create_ynab_category_group(
+            id="group-1",
+            name="Monthly Bills",
+            categories=[create_ynab_category(id="cat-1", name="Rent")],
+        )
+    ]
+
+    with patch.object(
+        server.Category, "from_ynab", wraps=server.Category.from_ynab
+    ) as from_ynab:
+        for _ in range(2):
+            result = await mcp_client.call_tool("list_categories", {})
+            response_data = extract_response_data(result)
+            assert [c["id"] for c in response_data["categories"]] == ["cat-1"]
+
+        # The second call reuses the categories converted by the first
+        assert from_ynab.call_count == 1
+
+        # A sync replaces the repository's category group list
+        mock_repository.get_category_groups.return_value = [
+            create_ynab_category_group(
+                id="group-1",
+                name="Monthly Bills",
+                categories=[create_ynab_category(id="cat-2", name="Electric")],
+            )
+        ]
+
+        result = await mcp_client.call_tool("list_categories", {})
+        response_data = extract_response_data(result)
+        assert [c["id"] for c in response_data["categories"]] == ["cat-2"]
+        assert from_ynab.call_count == 2
+
+
 async def test_list_category_groups_success(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test successful category group listing."""
 
-    category = ynab.Category(
+    category = create_ynab_category(
         id="cat-1",
-        category_group_id="group-1",
         category_group_name="Monthly Bills",
         name="Test Category",
-        hidden=False,
-        original_category_group_id=None,
-        note=None,
-        budgeted=50000,
-        activity=-30000,
-        balance=20000,
-        goal_type=None,
-        goal_needs_whole_amount=None,
-        goal_day=None,
-        goal_cadence=None,
-        goal_cadence_frequency=None,
-        goal_creation_month=None,
-        goal_target=None,
-        goal_target_month=None,
-        goal_percentage_complete=None,
-        goal_months_to_budget=None,
-        goal_under_funded=None,
-        goal_overall_funded=None,
-        goal_overall_left=None,
-        deleted=False,
     )
 
-    category_group = ynab.CategoryGroupWithCategories(
+    category_group = create_ynab_category_group(
         id="group-1",
         name="Monthly Bills",
-        hidden=False,
-        deleted=False,
         categories=[category],
     )
 
@@ -115,119 +135,22 @@ async def test_list_category_groups_success(
     assert group["name"] == "Monthly Bills"
 
 
-async def test_list_categories_filters_deleted_and_hidden(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
-) -> None:
-    """Test that list_categories automatically filters out deleted and hidden."""
-
-    # Active category (should be included)
-    mock_active_category = ynab.Category(
-        id="cat-active",
-        name="Active Category",
-        category_group_id="group-1",
-        hidden=False,
-        deleted=False,
-        note="Active",
-        budgeted=10000,
-        activity=-5000,
-        balance=5000,
-        goal_type=None,
-        goal_target=None,
-        goal_percentage_complete=None,
-        goal_under_funded=None,
-        goal_creation_month=None,
-        goal_target_month=None,
-        goal_overall_funded=None,
-        goal_overall_left=None,
-    )
-
-    # Hidden category (should be excluded)
-    mock_hidden_category = ynab.Category(
-        id="cat-hidden",
-        name="Hidden Category",
-        category_group_id="group-1",
-        hidden=True,
-        deleted=False,
-        note="Hidden",
-        budgeted=0,
-        activity=0,
-        balance=0,
-        goal_type=None,
-        goal_target=None,
-        goal_percentage_complete=None,
-        goal_under_funded=None,
-        goal_creation_month=None,
-        goal_target_month=None,
-        goal_overall_funded=None,
-        goal_overall_left=None,
-    )
-
-    # Deleted category (should be excluded)
-    mock_deleted_category = ynab.Category(
-        id="cat-deleted",
-        name="Deleted Category",
-        category_group_id="group-1",
-        hidden=False,
-        deleted=True,
-        note="Deleted",
-        budgeted=0,
-        activity=0,
-        balance=0,
-        goal_type=None,
-        goal_target=None,
-        goal_percentage_complete=None,
-        goal_under_funded=None,
-        goal_creation_month=None,
-        goal_target_month=None,
-        goal_overall_funded=None,
-        goal_overall_left=None,
-    )
-
-    category_group = ynab.CategoryGroupWithCategories(
-        id="group-1",
-        name="Monthly Bills",
-        hidden=False,
-        deleted=False,
-        categories=[
-            mock_active_category,
-            mock_hidden_category,
-            mock_deleted_category,
-        ],
-    )
-
-    # Mock repository to return category groups
-    mock_repository.get_category_groups.return_value = [category_group]
-
-    result = await mcp_client.call_tool("list_categories", {})
-
-    response_data = extract_response_data(result)
-    # Should only include the active category
-    assert len(response_data["categories"]) == 1
-    assert response_data["categories"][0]["id"] == "cat-active"
-    assert response_data["categories"][0]["name"] == "Active Category"
-
-
 async def test_list_category_groups_filters_deleted(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test that list_category_groups automatically filters out deleted groups."""
 
     # Active group (should be included)
-    active_group = ynab.CategoryGroupWithCategories(
+    active_group = create_ynab_category_group(
         id="group-active",
         name="Active Group",
-        hidden=False,
-        deleted=False,
-        categories=[],
     )
 
     # Deleted group (should be excluded)
-    deleted_group = ynab.CategoryGroupWithCategories(
+    deleted_group = create_ynab_category_group(
         id="group-deleted",
         name="Deleted Group",
-        hidden=False,
         deleted=True,
-        categories=[],
     )
 
     # Mock repository to return category groups
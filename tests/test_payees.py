@@ -2,16 +2,23 @@
 Test suite for payee-related functionality in YNAB MCP Server.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import NonCallableMock, patch
 
-import ynab
-from assertions import extract_response_data
+import pytest
+from assertions import assert_pagination_info, extract_response_data
 from conftest import create_ynab_payee
 from fastmcp.client import Client, FastMCPTransport
 
+import server
+
+# Store 00, Store 01, etc. for predictable sorting; the server never mutates these
+_STORE_PAYEES = tuple(
+    create_ynab_payee(id=f"payee-{i}", name=f"Store {i:02d}") for i in range(5)
+)
+
 
 async def test_list_payees_success(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test successful payee listing."""
 
@@ -61,28 +68,16 @@ async def test_list_payees_success(
 
 
 async def test_list_payees_pagination(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test payee listing with pagination."""
 
-    # Create multiple payees
-    payees = []
-    for i in range(5):
-        payee = ynab.Payee(
-            id=f"payee-{i}",
-            name=f"Store {i:02d}",  # Store 00, Store 01, etc. for predictable sorting
-            transfer_account_id=None,
-            deleted=False,
-        )
-        payees.append(payee)
-
-    mock_repository.get_payees.return_value = payees
+    mock_repository.get_payees.return_value = list(_STORE_PAYEES)
 
     # Test first page
     result = await mcp_client.call_tool("list_payees", {"limit": 2, "offset": 0})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["payees"]) == 2
     assert response_data["pagination"]["total_count"] == 5
     assert response_data["pagination"]["has_more"] is True
@@ -93,24 +88,16 @@ async def test_list_payees_pagination(
 
 
 async def test_list_payees_filters_deleted(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test that list_payees automatically filters out deleted payees."""
 
     # Active payee (should be included)
-    payee_active = ynab.Payee(
-        id="payee-active",
-        name="Active Store",
-        transfer_account_id=None,
-        deleted=False,
-    )
+    payee_active = create_ynab_payee(id="payee-active", name="Active Store")
 
     # Deleted payee (should be excluded)
-    payee_deleted = ynab.Payee(
-        id="payee-deleted",
-        name="Deleted Store",
-        transfer_account_id=None,
-        deleted=True,
+    payee_deleted = create_ynab_payee(
+        id="payee-deleted", name="Deleted Store", deleted=True
     )
 
     mock_repository.get_payees.return_value = [payee_active, payee_deleted]
@@ -118,28 +105,91 @@ async def test_list_payees_filters_deleted(
     result = await mcp_client.call_tool("list_payees", {})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     # Should only include the active payee
     assert len(response_data["payees"]) == 1
     assert response_data["payees"][0]["name"] == "Active Store"
     assert response_data["payees"][0]["id"] == "payee-active"
 
 
+async def test_list_payees_reflects_repository_sync(
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
+) -> None:
+    """Test that sorted payees are reused until the repository syncs new payees."""
+
+    mock_repository.get_payees.return_value = [
+        create_ynab_payee(id="payee-2", name="Whole Foods"),
+        create_ynab_payee(id="payee-1", name="Amazon"),
+    ]
+
+    with patch.object(
+        server.Payee, "from_ynab", wraps=server.Payee.from_ynab
+    ) as from_ynab:
+        for _ in range(2):
+            result = await mcp_client.call_tool("list_payees", {})
+            response_data = extract_response_data(result)
+            assert [payee["name"] for payee in response_data["payees"]] == [
+                "Amazon",
+                "Whole Foods",
+            ]
+
+        # The second call reuses the payees converted by the first
+        assert from_ynab.call_count == 2
+
+        # A sync replaces the repository's payee list
+        mock_repository.get_payees.return_value = [
+            create_ynab_payee(id="payee-3", name="Costco"),
+        ]
+
+        result = await mcp_client.call_tool("list_payees", {})
+        response_data = extract_response_data(result)
+        assert [payee["name"] for payee in response_data["payees"]] == ["Costco"]
+        assert from_ynab.call_count == 3
+
+
+async def test_find_payee_reflects_repository_sync(
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
+) -> None:
+    """Test that lowercased search names are rebuilt when a sync deletes a payee."""
+
+    mock_repository.get_payees.return_value = [
+        create_ynab_payee(id="payee-1", name="Amazon"),
+    ]
+
+    with patch.object(
+        server.Payee, "from_ynab", wraps=server.Payee.from_ynab
+    ) as from_ynab:
+        for search_term in ["amazon", "AMAZON"]:
+            result = await mcp_client.call_tool(
+                "find_payee", {"name_search": search_term}
+            )
+            response_data = extract_response_data(result)
+            assert [payee["id"] for payee in response_data["payees"]] == ["payee-1"]
+
+        # Both searches share the payees and search names built by the first
+        assert from_ynab.call_count == 1
+
+        # A sync replaces the repository's payee list with the payee now deleted
+        mock_repository.get_payees.return_value = [
+            create_ynab_payee(id="payee-1", name="Amazon", deleted=True),
+            create_ynab_payee(id="payee-2", name="Costco"),
+        ]
+
+        result = await mcp_client.call_tool("find_payee", {"name_search": "amazon"})
+        response_data = extract_response_data(result)
+        assert response_data["payees"] == []
+        assert from_ynab.call_count == 2
+
+
 async def test_find_payee_filters_deleted(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test that find_payee automatically filters out deleted payees."""
 
     # Both payees have "amazon" in name, but one is deleted
-    payee_active = ynab.Payee(
-        id="payee-active", name="Amazon", transfer_account_id=None, deleted=False
-    )
+    payee_active = create_ynab_payee(id="payee-active", name="Amazon")
 
-    payee_deleted = ynab.Payee(
-        id="payee-deleted",
-        name="Amazon Prime",
-        transfer_account_id=None,
-        deleted=True,
+    payee_deleted = create_ynab_payee(
+        id="payee-deleted", name="Amazon Prime", deleted=True
     )
 
     mock_repository.get_payees.return_value = [payee_active, payee_deleted]
@@ -147,7 +197,6 @@ async def test_find_payee_filters_deleted(
     result = await mcp_client.call_tool("find_payee", {"name_search": "amazon"})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     # Should only find the active Amazon payee, not the deleted one
     assert len(response_data["payees"]) == 1
     assert response_data["payees"][0]["name"] == "Amazon"
@@ -155,42 +204,17 @@ async def test_find_payee_filters_deleted(
 
 
 async def test_find_payee_success(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test successful payee search by name."""
 
     # Create payees with different names for searching
     payees = [
-        ynab.Payee(
-            id="payee-amazon",
-            name="Amazon",
-            transfer_account_id=None,
-            deleted=False,
-        ),
-        ynab.Payee(
-            id="payee-amazon-web",
-            name="Amazon Web Services",
-            transfer_account_id=None,
-            deleted=False,
-        ),
-        ynab.Payee(
-            id="payee-starbucks",
-            name="Starbucks",
-            transfer_account_id=None,
-            deleted=False,
-        ),
-        ynab.Payee(
-            id="payee-grocery",
-            name="Whole Foods Market",
-            transfer_account_id=None,
-            deleted=False,
-        ),
-        ynab.Payee(
-            id="payee-deleted",
-            name="Amazon Prime",
-            transfer_account_id=None,
-            deleted=True,
-        ),
+        create_ynab_payee(id="payee-amazon", name="Amazon"),
+        create_ynab_payee(id="payee-amazon-web", name="Amazon Web Services"),
+        create_ynab_payee(id="payee-starbucks", name="Starbucks"),
+        create_ynab_payee(id="payee-grocery", name="Whole Foods Market"),
+        create_ynab_payee(id="payee-deleted", name="Amazon Prime", deleted=True),
     ]
 
     mock_repository.get_payees.return_value = payees
@@ -199,7 +223,6 @@ async def test_find_payee_success(
     result = await mcp_client.call_tool("find_payee", {"name_search": "amazon"})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     # Should find Amazon and Amazon Web Services, but not deleted Amazon Prime
     assert len(response_data["payees"]) == 2
     assert response_data["pagination"]["total_count"] == 2
@@ -210,59 +233,41 @@ async def test_find_payee_success(
     assert payee_names == ["Amazon", "Amazon Web Services"]
 
 
+@pytest.mark.parametrize(
+    ("search_term", "expected_names"),
+    [
+        ("STARBUCKS", ["Starbucks Coffee"]),
+        ("starbucks", ["Starbucks Coffee"]),
+        ("StArBuCkS", ["Starbucks Coffee"]),
+        ("coffee", ["Starbucks Coffee"]),
+        ("COFFEE", ["Starbucks Coffee"]),
+        ("nonexistent", []),
+    ],
+)
 async def test_find_payee_case_insensitive(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock,
+    mcp_client: Client[FastMCPTransport],
+    search_term: str,
+    expected_names: list[str],
 ) -> None:
     """Test that payee search is case-insensitive."""
 
-    payees = [
-        ynab.Payee(
-            id="payee-1",
-            name="Starbucks Coffee",
-            transfer_account_id=None,
-            deleted=False,
-        )
-    ]
+    payees = [create_ynab_payee(id="payee-1", name="Starbucks Coffee")]
 
     mock_repository.get_payees.return_value = payees
 
-    # Test various case combinations
-    search_terms_matches = [
-        ("STARBUCKS", 1),
-        ("starbucks", 1),
-        ("StArBuCkS", 1),
-        ("coffee", 1),
-        ("COFFEE", 1),
-        ("nonexistent", 0),  # This will test the else branch
-    ]
-
-    for search_term, expected_count in search_terms_matches:
-        result = await mcp_client.call_tool("find_payee", {"name_search": search_term})
+    result = await mcp_client.call_tool("find_payee", {"name_search": search_term})
 
-        response_data = extract_response_data(result)
-        assert len(response_data["payees"]) == expected_count
-        if expected_count > 0:
-            assert response_data["payees"][0]["name"] == "Starbucks Coffee"
+    response_data = extract_response_data(result)
+    assert [payee["name"] for payee in response_data["payees"]] == expected_names
 
 
 async def test_find_payee_limit(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test payee search with limit parameter."""
 
-    # Create multiple payees with "store" in the name
-    payees = []
-    for i in range(5):
-        payees.append(
-            ynab.Payee(
-                id=f"payee-{i}",
-                name=f"Store {i:02d}",  # Store 00, Store 01, etc.
-                transfer_account_id=None,
-                deleted=False,
-            )
-        )
-
-    mock_repository.get_payees.return_value = payees
+    mock_repository.get_payees.return_value = list(_STORE_PAYEES)
 
     # Test with limit of 2
     result = await mcp_client.call_tool(
@@ -270,7 +275,6 @@ async def test_find_payee_limit(
     )
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["payees"]) == 2
     assert response_data["pagination"]["total_count"] == 5
     assert response_data["pagination"]["has_more"] is True
@@ -281,22 +285,33 @@ async def test_find_payee_limit(
 
 
 async def test_find_payee_no_matches(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test payee search with no matching results."""
 
-    payees = [
-        ynab.Payee(
-            id="payee-1", name="Starbucks", transfer_account_id=None, deleted=False
-        )
-    ]
+    payees = [create_ynab_payee(id="payee-1", name="Starbucks")]
 
     mock_repository.get_payees.return_value = payees
 
     result = await mcp_client.call_tool("find_payee", {"name_search": "nonexistent"})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["payees"]) == 0
     assert response_data["pagination"]["total_count"] == 0
     assert response_data["pagination"]["has_more"] is False
+
+
+@pytest.mark.parametrize("search_term", ["", "   "])
+async def test_find_payee_blank_search(
+    mock_repository: NonCallableMock,
+    mcp_client: Client[FastMCPTransport],
+    search_term: str,
+) -> None:
+    """Test that a blank payee search returns nothing without loading payees."""
+
+    result = await mcp_client.call_tool("find_payee", {"name_search": search_term})
+
+    response_data = extract_response_data(result)
+    assert response_data["payees"] == []
+    assert_pagination_info(response_data["pagination"], total_count=0, limit=10)
+    mock_repository.get_payees.assert_not_called()
@@ -5,13 +5,20 @@ Test suite for YNABRepository differential sync functionality.
 import logging
 import threading
 import time
-from datetime import date, datetime, timedelta
-from typing import Any
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+from unittest.mock import Mock, patch
 
 import pytest
 import ynab
-from conftest import create_ynab_account, create_ynab_payee
+from conftest import (
+    create_ynab_account,
+    create_ynab_category_group,
+    create_ynab_payee,
+    create_ynab_transaction,
+)
 from ynab.exceptions import ConflictException
 
 from repository import YNABRepository
@@ -28,123 +35,212 @@ def repository() -> YNABRepository:
     return repo
 
 
-def test_repository_initial_sync(repository: YNABRepository) -> None:
+class SyncedEntity(NamedTuple):
+    """How one repository entity type is fetched from the YNAB API."""
+
+    data_key: str
+    api_name: str
+    api_method: str
+    build_response: Callable[[list[Any], int], Any]
+    create: Callable[..., Any]
+    changed_field: str
+
+
+_SYNCED_ENTITIES = [
+    pytest.param(
+        SyncedEntity(
+            "accounts",
+            "accounts_api",
+            "get_accounts",
+            lambda entities, knowledge: ynab.AccountsResponse(
+                data=ynab.AccountsResponseData(
+                    accounts=entities, server_knowledge=knowledge
+                )
+            ),
+            create_ynab_account,
+            "name",
+        ),
+        id="accounts",
+    ),
+    pytest.param(
+        SyncedEntity(
+            "payees",
+            "payees_api",
+            "get_payees",
+            lambda entities, knowledge: ynab.PayeesResponse(
+                data=ynab.PayeesResponseData(
+                    payees=entities, server_knowledge=knowledge
+                )
+            ),
+            create_ynab_payee,
+            "name",
+        ),
+        id="payees",
+    ),
+    pytest.param(
+        SyncedEntity(
+            "category_groups",
+            "categories_api",
+            "get_categories",
+            lambda entities, knowledge: ynab.CategoriesResponse(
+                data=ynab.CategoriesResponseData(
+                    category_groups=entities, server_knowledge=knowledge
+                )
+            ),
+            create_ynab_category_group,
+            "name",
+        ),
+        id="category_groups",
+    ),
+    pytest.param(
+        SyncedEntity(
+            "transactions",
+            "transactions_api",
+            "get_transactions",
+            lambda entities, knowledge: ynab.TransactionsResponse(
+                data=ynab.TransactionsResponseData(
+                    transactions=entities, server_knowledge=knowledge
+                )
+            ),
+            create_ynab_transaction,
+            "memo",
+        ),
+        id="transactions",
+    ),
+]
+
+
+def _mock_api_method(ynab_apis: SimpleNamespace, entity: SyncedEntity) -> Mock:
+    """Get the mocked API method the repository calls to fetch this entity type."""
+    api_method: Mock = getattr(getattr(ynab_apis, entity.api_name), entity.api_method)
+    return api_method
+
+
+@pytest.mark.parametrize("entity", _SYNCED_ENTITIES)
+def test_repository_initial_sync(
+    repository: YNABRepository, ynab_apis: SimpleNamespace, entity: SyncedEntity
+) -> None:
     """Test repository initial sync without server knowledge."""
-    account1 = create_ynab_account(id="acc-1", name="Checking")
-    account2 = create_ynab_account(id="acc-2", name="Savings")
+    first = entity.create(id="entity-1", **{entity.changed_field: "First"})
+    second = entity.create(id="entity-2", **{entity.changed_field: "Second"})
 
-    accounts_response = ynab.AccountsResponse(
-        data=ynab.AccountsResponseData(
-            accounts=[account1, account2], server_knowledge=100
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    api_method = _mock_api_method(ynab_apis, entity)
+    api_method.return_value = entity.build_response([first, second], 100)
 
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = accounts_response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
+    getattr(repository, f"sync_{entity.data_key}")()
 
     # Verify initial sync called without last_knowledge_of_server
-    mock_accounts_api.get_accounts.assert_called_once_with("test-budget")
+    api_method.assert_called_once_with("test-budget")
 
     # Verify data was stored
-    accounts = repository.get_accounts()
-    assert len(accounts) == 2
-    assert accounts[0].id == "acc-1"
-    assert accounts[1].id == "acc-2"
+    entities = getattr(repository, f"get_{entity.data_key}")()
+    assert [stored.id for stored in entities] == ["entity-1", "entity-2"]
 
     # Verify server knowledge was stored
-    assert repository._server_knowledge["accounts"] == 100
+    assert repository._server_knowledge[entity.data_key] == 100
     assert repository.is_initialized()
 
 
-def test_repository_delta_sync(repository: YNABRepository) -> None:
+@pytest.mark.parametrize("entity", _SYNCED_ENTITIES)
+def test_repository_delta_sync(
+    repository: YNABRepository, ynab_apis: SimpleNamespace, entity: SyncedEntity
+) -> None:
     """Test repository delta sync with server knowledge."""
     # Set up initial state
-    account1 = create_ynab_account(id="acc-1", name="Checking")
-    repository._data["accounts"] = [account1]
-    repository._server_knowledge["accounts"] = 100
+    repository._data[entity.data_key] = [
+        entity.create(id="entity-1", **{entity.changed_field: "Original"})
+    ]
+    repository._server_knowledge[entity.data_key] = 100
     repository._last_sync = datetime.now()
 
-    # Delta sync with updated account and new account
-    updated_account1 = create_ynab_account(id="acc-1", name="Updated Checking")
-    new_account = create_ynab_account(id="acc-2", name="New Savings")
+    # Delta sync with updated entity and new entity
+    updated = entity.create(id="entity-1", **{entity.changed_field: "Updated"})
+    added = entity.create(id="entity-2", **{entity.changed_field: "Added"})
 
-    delta_response = ynab.AccountsResponse(
-        data=ynab.AccountsResponseData(
-            accounts=[updated_account1, new_account], server_knowledge=110
-        )
-    )
+    api_method = _mock_api_method(ynab_apis, entity)
+    api_method.return_value = entity.build_response([updated, added], 110)
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = delta_response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
+    getattr(repository, f"sync_{entity.data_key}")()
 
     # Verify delta sync called with last_knowledge_of_server
-    mock_accounts_api.get_accounts.assert_called_once_with(
-        "test-budget", last_knowledge_of_server=100
-    )
+    api_method.assert_called_once_with("test-budget", last_knowledge_of_server=100)
 
     # Verify deltas were applied
-    accounts = repository.get_accounts()
-    assert len(accounts) == 2
-
-    # Find accounts by ID
-    acc1 = next(acc for acc in accounts if acc.id == "acc-1")
-    acc2 = next(acc for acc in accounts if acc.id == "acc-2")
-
-    assert acc1.name == "Updated Checking"  # Updated
-    assert acc2.name == "New Savings"  # Added
+    entities = getattr(repository, f"get_{entity.data_key}")()
+    assert {
+        stored.id: getattr(stored, entity.changed_field) for stored in entities
+    } == {"entity-1": "Updated", "entity-2": "Added"}
 
     # Verify server knowledge was updated
-    assert repository._server_knowledge["accounts"] == 110
+    assert repository._server_knowledge[entity.data_key] == 110
 
 
-def test_repository_handles_deleted_accounts(repository: YNABRepository) -> None:
-    """Test repository handles deleted accounts in delta sync."""
-    # Set up initial state with two accounts
-    account1 = create_ynab_account(id="acc-1", name="Checking")
-    account2 = create_ynab_account(id="acc-2", name="Savings")
-    repository._data["accounts"] = [account1, account2]
-    repository._server_knowledge["accounts"] = 100
+@pytest.mark.parametrize("entity", _SYNCED_ENTITIES)
+def test_repository_handles_deleted(
+    repository: YNABRepository, ynab_apis: SimpleNamespace, entity: SyncedEntity
+) -> None:
+    """Test repository removes entities deleted in a delta sync."""
+    # Set up initial state with two entities
+    repository._data[entity.data_key] = [
+        entity.create(id="entity-1"),
+        entity.create(id="entity-2"),
+    ]
+    repository._server_knowledge[entity.data_key] = 100
     repository._last_sync = datetime.now()
 
-    # Delta with one deleted account
-    deleted_account = create_ynab_account(id="acc-2", name="Savings", deleted=True)
+    # Delta with one deleted entity
+    _mock_api_method(ynab_apis, entity).return_value = entity.build_response(
+        [entity.create(id="entity-2", deleted=True)], 110
+    )
+
+    getattr(repository, f"sync_{entity.data_key}")()
 
-    delta_response = ynab.AccountsResponse(
-        data=ynab.AccountsResponseData(accounts=[deleted_account], server_knowledge=110)
+    # Verify deleted entity was removed
+    entities = getattr(repository, f"get_{entity.data_key}")()
+    assert [stored.id for stored in entities] == ["entity-1"]
+
+
+@pytest.mark.parametrize("entity", _SYNCED_ENTITIES)
+def test_repository_full_sync_drops_deleted(
+    repository: YNABRepository, ynab_apis: SimpleNamespace, entity: SyncedEntity
+) -> None:
+    """Test repository drops deleted entities returned by a full sync."""
+    _mock_api_method(ynab_apis, entity).return_value = entity.build_response(
+        [entity.create(id="entity-1"), entity.create(id="entity-2", deleted=True)],
+        100,
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    getattr(repository, f"sync_{entity.data_key}")()
 
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = delta_response
+    # Verify only the active entity was stored
+    entities = getattr(repository, f"get_{entity.data_key}")()
+    assert [stored.id for stored in entities] == ["entity-1"]
 
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
 
-    # Verify deleted account was removed
-    accounts = repository.get_accounts()
-    assert len(accounts) == 1
-    assert accounts[0].id == "acc-1"  # Only checking account remains
+@pytest.mark.parametrize("entity", _SYNCED_ENTITIES)
+def test_repository_lazy_initialization(
+    repository: YNABRepository, ynab_apis: SimpleNamespace, entity: SyncedEntity
+) -> None:
+    """Test repository initializes automatically when data is requested."""
+    api_method = _mock_api_method(ynab_apis, entity)
+    api_method.return_value = entity.build_response([entity.create(id="entity-1")], 100)
+
+    # Repository is not initialized initially
+    assert not repository.is_initialized()
+
+    # Requesting the data should trigger sync
+    entities = getattr(repository, f"get_{entity.data_key}")()
+
+    # Verify sync was called
+    api_method.assert_called_once()
+
+    # Verify data is available
+    assert [stored.id for stored in entities] == ["entity-1"]
+    assert repository.is_initialized()
 
 
 def test_repository_fallback_to_full_refresh_on_error(
-    repository: YNABRepository,
+    repository: YNABRepository, ynab_apis: SimpleNamespace
 ) -> None:
     """Test repository falls back to full refresh when delta sync fails."""
     # Set up initial state
@@ -160,20 +256,15 @@ def test_repository_fallback_to_full_refresh_on_error(
         )
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    # First call (delta) raises API exception
+    # Second call (full refresh) succeeds
+    mock_accounts_api.get_accounts.side_effect = [
+        ynab.ApiException(status=500, reason="Server Error"),
+        full_response,
+    ]
 
-        mock_accounts_api = MagicMock()
-        # First call (delta) raises API exception
-        # Second call (full refresh) succeeds
-        mock_accounts_api.get_accounts.side_effect = [
-            ynab.ApiException(status=500, reason="Server Error"),
-            full_response,
-        ]
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
+    repository.sync_accounts()
 
     # Verify two calls were made
     assert mock_accounts_api.get_accounts.call_count == 2
@@ -194,38 +285,9 @@ def test_repository_fallback_to_full_refresh_on_error(
     assert repository._server_knowledge["accounts"] == 120
 
 
-def test_repository_lazy_initialization(repository: YNABRepository) -> None:
-    """Test repository initializes automatically when data is requested."""
-    account1 = create_ynab_account(id="acc-1", name="Checking")
-
-    accounts_response = ynab.AccountsResponse(
-        data=ynab.AccountsResponseData(accounts=[account1], server_knowledge=100)
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = accounts_response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            # Repository is not initialized initially
-            assert not repository.is_initialized()
-
-            # Calling get_accounts should trigger sync
-            accounts = repository.get_accounts()
-
-    # Verify sync was called
-    mock_accounts_api.get_accounts.assert_called_once()
-
-    # Verify data is available
-    assert len(accounts) == 1
-    assert accounts[0].id == "acc-1"
-    assert repository.is_initialized()
-
-
-def test_repository_thread_safety(repository: YNABRepository) -> None:
+def test_repository_thread_safety(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test repository operations are thread-safe."""
     # This test verifies the locking mechanism works
     account1 = create_ynab_account(id="acc-1", name="Checking")
@@ -234,20 +296,15 @@ def test_repository_thread_safety(repository: YNABRepository) -> None:
         data=ynab.AccountsResponseData(accounts=[account1], server_knowledge=100)
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.return_value = accounts_response
 
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = accounts_response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            # Multiple calls should be safe
-            repository.sync_accounts()
-            accounts1 = repository.get_accounts()
-            accounts2 = repository.get_accounts()
-            last_sync1 = repository.last_sync_time()
-            last_sync2 = repository.last_sync_time()
+    # Multiple calls should be safe
+    repository.sync_accounts()
+    accounts1 = repository.get_accounts()
+    accounts2 = repository.get_accounts()
+    last_sync1 = repository.last_sync_time()
+    last_sync2 = repository.last_sync_time()
 
     # All operations should complete successfully
     assert len(accounts1) == 1
@@ -257,506 +314,6 @@ def test_repository_thread_safety(repository: YNABRepository) -> None:
     assert last_sync1 == last_sync2
 
 
-def test_repository_payees_initial_sync(repository: YNABRepository) -> None:
-    """Test repository initial sync for payees without server knowledge."""
-    payee1 = create_ynab_payee(id="payee-1", name="Amazon")
-    payee2 = create_ynab_payee(id="payee-2", name="Starbucks")
-
-    payees_response = ynab.PayeesResponse(
-        data=ynab.PayeesResponseData(payees=[payee1, payee2], server_knowledge=100)
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_payees_api = MagicMock()
-        mock_payees_api.get_payees.return_value = payees_response
-
-        with patch("ynab.PayeesApi", return_value=mock_payees_api):
-            repository.sync_payees()
-
-    # Verify initial sync called without last_knowledge_of_server
-    mock_payees_api.get_payees.assert_called_once_with("test-budget")
-
-    # Verify data was stored
-    payees = repository.get_payees()
-    assert len(payees) == 2
-    assert payees[0].id == "payee-1"
-    assert payees[1].id == "payee-2"
-
-    # Verify server knowledge was stored
-    assert repository._server_knowledge["payees"] == 100
-
-
-def test_repository_payees_delta_sync(repository: YNABRepository) -> None:
-    """Test repository delta sync for payees with server knowledge."""
-    # Set up initial state
-    payee1 = create_ynab_payee(id="payee-1", name="Amazon")
-    repository._data["payees"] = [payee1]
-    repository._server_knowledge["payees"] = 100
-    repository._last_sync = datetime.now()
-
-    # Delta sync with updated payee and new payee
-    updated_payee1 = create_ynab_payee(id="payee-1", name="Amazon.com")
-    new_payee = create_ynab_payee(id="payee-2", name="Target")
-
-    delta_response = ynab.PayeesResponse(
-        data=ynab.PayeesResponseData(
-            payees=[updated_payee1, new_payee], server_knowledge=110
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_payees_api = MagicMock()
-        mock_payees_api.get_payees.return_value = delta_response
-
-        with patch("ynab.PayeesApi", return_value=mock_payees_api):
-            repository.sync_payees()
-
-    # Verify delta sync called with last_knowledge_of_server
-    mock_payees_api.get_payees.assert_called_once_with(
-        "test-budget", last_knowledge_of_server=100
-    )
-
-    # Verify deltas were applied
-    payees = repository.get_payees()
-    assert len(payees) == 2
-
-    # Find payees by ID
-    p1 = next(p for p in payees if p.id == "payee-1")
-    p2 = next(p for p in payees if p.id == "payee-2")
-
-    assert p1.name == "Amazon.com"  # Updated
-    assert p2.name == "Target"  # Added
-
-    # Verify server knowledge was updated
-    assert repository._server_knowledge["payees"] == 110
-
-
-def test_repository_payees_handles_deleted(repository: YNABRepository) -> None:
-    """Test repository handles deleted payees in delta sync."""
-    # Set up initial state with two payees
-    payee1 = create_ynab_payee(id="payee-1", name="Amazon")
-    payee2 = create_ynab_payee(id="payee-2", name="Old Store")
-    repository._data["payees"] = [payee1, payee2]
-    repository._server_knowledge["payees"] = 100
-    repository._last_sync = datetime.now()
-
-    # Delta with one deleted payee
-    deleted_payee = create_ynab_payee(id="payee-2", name="Old Store", deleted=True)
-
-    delta_response = ynab.PayeesResponse(
-        data=ynab.PayeesResponseData(payees=[deleted_payee], server_knowledge=110)
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_payees_api = MagicMock()
-        mock_payees_api.get_payees.return_value = delta_response
-
-        with patch("ynab.PayeesApi", return_value=mock_payees_api):
-            repository.sync_payees()
-
-    # Verify deleted payee was removed
-    payees = repository.get_payees()
-    assert len(payees) == 1
-    assert payees[0].id == "payee-1"  # Only Amazon remains
-
-
-def test_repository_payees_lazy_initialization(repository: YNABRepository) -> None:
-    """Test payees repository initializes automatically when data is requested."""
-    payee1 = create_ynab_payee(id="payee-1", name="Amazon")
-
-    payees_response = ynab.PayeesResponse(
-        data=ynab.PayeesResponseData(payees=[payee1], server_knowledge=100)
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_payees_api = MagicMock()
-        mock_payees_api.get_payees.return_value = payees_response
-
-        with patch("ynab.PayeesApi", return_value=mock_payees_api):
-            # Repository payees is not initialized initially
-            assert "payees" not in repository._data
-
-            # Calling get_payees should trigger sync
-            payees = repository.get_payees()
-
-    # Verify sync was called
-    mock_payees_api.get_payees.assert_called_once()
-
-    # Verify data is available
-    assert len(payees) == 1
-    assert payees[0].id == "payee-1"
-
-
-def create_ynab_category_group(
-    *,
-    id: str = "group-1",
-    name: str = "Test Group",
-    deleted: bool = False,
-    **kwargs: Any,
-) -> ynab.CategoryGroupWithCategories:
-    """Create a YNAB CategoryGroupWithCategories for testing with sensible defaults."""
-    categories = kwargs.get("categories", [])
-    return ynab.CategoryGroupWithCategories(
-        id=id,
-        name=name,
-        hidden=kwargs.get("hidden", False),
-        deleted=deleted,
-        categories=categories,
-    )
-
-
-def test_repository_category_groups_initial_sync(repository: YNABRepository) -> None:
-    """Test repository initial sync for category groups without server knowledge."""
-    group1 = create_ynab_category_group(id="group-1", name="Monthly Bills")
-    group2 = create_ynab_category_group(id="group-2", name="Everyday Expenses")
-
-    categories_response = ynab.CategoriesResponse(
-        data=ynab.CategoriesResponseData(
-            category_groups=[group1, group2], server_knowledge=100
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_categories_api = MagicMock()
-        mock_categories_api.get_categories.return_value = categories_response
-
-        with patch("ynab.CategoriesApi", return_value=mock_categories_api):
-            repository.sync_category_groups()
-
-    # Verify initial sync called without last_knowledge_of_server
-    mock_categories_api.get_categories.assert_called_once_with("test-budget")
-
-    # Verify data was stored
-    category_groups = repository.get_category_groups()
-    assert len(category_groups) == 2
-    assert category_groups[0].id == "group-1"
-    assert category_groups[1].id == "group-2"
-
-    # Verify server knowledge was stored
-    assert repository._server_knowledge["category_groups"] == 100
-
-
-def test_repository_category_groups_delta_sync(repository: YNABRepository) -> None:
-    """Test repository delta sync for category groups with server knowledge."""
-    # Set up initial state
-    group1 = create_ynab_category_group(id="group-1", name="Monthly Bills")
-    repository._data["category_groups"] = [group1]
-    repository._server_knowledge["category_groups"] = 100
-    repository._last_sync = datetime.now()
-
-    # Delta sync with updated group and new group
-    updated_group1 = create_ynab_category_group(id="group-1", name="Fixed Expenses")
-    new_group = create_ynab_category_group(id="group-2", name="Variable Expenses")
-
-    delta_response = ynab.CategoriesResponse(
-        data=ynab.CategoriesResponseData(
-            category_groups=[updated_group1, new_group], server_knowledge=110
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_categories_api = MagicMock()
-        mock_categories_api.get_categories.return_value = delta_response
-
-        with patch("ynab.CategoriesApi", return_value=mock_categories_api):
-            repository.sync_category_groups()
-
-    # Verify delta sync called with last_knowledge_of_server
-    mock_categories_api.get_categories.assert_called_once_with(
-        "test-budget", last_knowledge_of_server=100
-    )
-
-    # Verify deltas were applied
-    category_groups = repository.get_category_groups()
-    assert len(category_groups) == 2
-
-    # Find groups by ID
-    g1 = next(g for g in category_groups if g.id == "group-1")
-    g2 = next(g for g in category_groups if g.id == "group-2")
-
-    assert g1.name == "Fixed Expenses"  # Updated
-    assert g2.name == "Variable Expenses"  # Added
-
-    # Verify server knowledge was updated
-    assert repository._server_knowledge["category_groups"] == 110
-
-
-def test_repository_category_groups_handles_deleted(repository: YNABRepository) -> None:
-    """Test repository handles deleted category groups in delta sync."""
-    # Set up initial state with two groups
-    group1 = create_ynab_category_group(id="group-1", name="Monthly Bills")
-    group2 = create_ynab_category_group(id="group-2", name="Old Category")
-    repository._data["category_groups"] = [group1, group2]
-    repository._server_knowledge["category_groups"] = 100
-    repository._last_sync = datetime.now()
-
-    # Delta with one deleted group
-    deleted_group = create_ynab_category_group(
-        id="group-2", name="Old Category", deleted=True
-    )
-
-    delta_response = ynab.CategoriesResponse(
-        data=ynab.CategoriesResponseData(
-            category_groups=[deleted_group], server_knowledge=110
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_categories_api = MagicMock()
-        mock_categories_api.get_categories.return_value = delta_response
-
-        with patch("ynab.CategoriesApi", return_value=mock_categories_api):
-            repository.sync_category_groups()
-
-    # Verify deleted group was removed
-    category_groups = repository.get_category_groups()
-    assert len(category_groups) == 1
-    assert category_groups[0].id == "group-1"  # Only Monthly Bills remains
-
-
-def test_repository_category_groups_lazy_initialization(
-    repository: YNABRepository,
-) -> None:
-    """Test category groups repository initializes automatically when data requested."""
-    group1 = create_ynab_category_group(id="group-1", name="Monthly Bills")
-
-    categories_response = ynab.CategoriesResponse(
-        data=ynab.CategoriesResponseData(category_groups=[group1], server_knowledge=100)
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_categories_api = MagicMock()
-        mock_categories_api.get_categories.return_value = categories_response
-
-        with patch("ynab.CategoriesApi", return_value=mock_categories_api):
-            # Repository category groups is not initialized initially
-            assert "category_groups" not in repository._data
-
-            # Calling get_category_groups should trigger sync
-            category_groups = repository.get_category_groups()
-
-    # Verify sync was called
-    mock_categories_api.get_categories.assert_called_once()
-
-    # Verify data is available
-    assert len(category_groups) == 1
-    assert category_groups[0].id == "group-1"
-
-
-def create_ynab_transaction(
-    *,
-    id: str = "txn-1",
-    account_id: str = "acc-1",
-    amount: int = -50_000,  # -$50.00
-    memo: str | None = "Test Transaction",
-    cleared: str = "cleared",
-    approved: bool = True,
-    deleted: bool = False,
-    **kwargs: Any,
-) -> ynab.TransactionDetail:
-    """Create a YNAB TransactionDetail for testing with sensible defaults."""
-    return ynab.TransactionDetail(
-        id=id,
-        date=kwargs.get("date", date.today()),
-        amount=amount,
-        memo=memo,
-        cleared=ynab.TransactionClearedStatus(cleared),
-        approved=approved,
-        flag_color=kwargs.get("flag_color"),
-        account_id=account_id,
-        account_name=kwargs.get("account_name", "Test Account"),
-        payee_id=kwargs.get("payee_id"),
-        payee_name=kwargs.get("payee_name", "Test Payee"),
-        category_id=kwargs.get("category_id"),
-        category_name=kwargs.get("category_name"),
-        transfer_account_id=kwargs.get("transfer_account_id"),
-        transfer_transaction_id=kwargs.get("transfer_transaction_id"),
-        matched_transaction_id=kwargs.get("matched_transaction_id"),
-        import_id=kwargs.get("import_id"),
-        import_payee_name=kwargs.get("import_payee_name"),
-        import_payee_name_original=kwargs.get("import_payee_name_original"),
-        debt_transaction_type=kwargs.get("debt_transaction_type"),
-        subtransactions=kwargs.get("subtransactions", []),
-        deleted=deleted,
-    )
-
-
-def test_repository_transactions_initial_sync(repository: YNABRepository) -> None:
-    """Test repository initial sync for transactions without server knowledge."""
-    txn1 = create_ynab_transaction(id="txn-1", amount=-25_000, memo="Groceries")
-    txn2 = create_ynab_transaction(id="txn-2", amount=-15_000, memo="Gas")
-
-    transactions_response = ynab.TransactionsResponse(
-        data=ynab.TransactionsResponseData(
-            transactions=[txn1, txn2], server_knowledge=100
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_transactions_api = MagicMock()
-        mock_transactions_api.get_transactions.return_value = transactions_response
-
-        with patch("ynab.TransactionsApi", return_value=mock_transactions_api):
-            repository.sync_transactions()
-
-    # Verify initial sync called without last_knowledge_of_server
-    mock_transactions_api.get_transactions.assert_called_once_with("test-budget")
-
-    # Verify data was stored
-    transactions = repository.get_transactions()
-    assert len(transactions) == 2
-    assert transactions[0].id == "txn-1"
-    assert transactions[1].id == "txn-2"
-
-    # Verify server knowledge was stored
-    assert repository._server_knowledge["transactions"] == 100
-
-
-def test_repository_transactions_delta_sync(repository: YNABRepository) -> None:
-    """Test repository delta sync for transactions with server knowledge."""
-    # Set up initial state
-    txn1 = create_ynab_transaction(id="txn-1", amount=-25_000, memo="Groceries")
-    repository._data["transactions"] = [txn1]
-    repository._server_knowledge["transactions"] = 100
-    repository._last_sync = datetime.now()
-
-    # Delta sync with updated transaction and new transaction
-    updated_txn1 = create_ynab_transaction(
-        id="txn-1", amount=-25_000, memo="Groceries (Updated)"
-    )
-    new_txn = create_ynab_transaction(id="txn-2", amount=-15_000, memo="Gas")
-
-    delta_response = ynab.TransactionsResponse(
-        data=ynab.TransactionsResponseData(
-            transactions=[updated_txn1, new_txn], server_knowledge=110
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_transactions_api = MagicMock()
-        mock_transactions_api.get_transactions.return_value = delta_response
-
-        with patch("ynab.TransactionsApi", return_value=mock_transactions_api):
-            repository.sync_transactions()
-
-    # Verify delta sync called with last_knowledge_of_server
-    mock_transactions_api.get_transactions.assert_called_once_with(
-        "test-budget", last_knowledge_of_server=100
-    )
-
-    # Verify deltas were applied
-    transactions = repository.get_transactions()
-    assert len(transactions) == 2
-
-    # Find transactions by ID
-    t1 = next(t for t in transactions if t.id == "txn-1")
-    t2 = next(t for t in transactions if t.id == "txn-2")
-
-    assert t1.memo == "Groceries (Updated)"  # Updated
-    assert t2.memo == "Gas"  # Added
-
-    # Verify server knowledge was updated
-    assert repository._server_knowledge["transactions"] == 110
-
-
-def test_repository_transactions_handles_deleted(repository: YNABRepository) -> None:
-    """Test repository handles deleted transactions in delta sync."""
-    # Set up initial state with two transactions
-    txn1 = create_ynab_transaction(id="txn-1", amount=-25_000, memo="Groceries")
-    txn2 = create_ynab_transaction(id="txn-2", amount=-15_000, memo="Gas")
-    repository._data["transactions"] = [txn1, txn2]
-    repository._server_knowledge["transactions"] = 100
-    repository._last_sync = datetime.now()
-
-    # Delta with one deleted transaction
-    deleted_txn = create_ynab_transaction(
-        id="txn-2", amount=-15_000, memo="Gas", deleted=True
-    )
-
-    delta_response = ynab.TransactionsResponse(
-        data=ynab.TransactionsResponseData(
-            transactions=[deleted_txn], server_knowledge=110
-        )
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_transactions_api = MagicMock()
-        mock_transactions_api.get_transactions.return_value = delta_response
-
-        with patch("ynab.TransactionsApi", return_value=mock_transactions_api):
-            repository.sync_transactions()
-
-    # Verify deleted transaction was removed
-    transactions = repository.get_transactions()
-    assert len(transactions) == 1
-    assert transactions[0].id == "txn-1"  # Only groceries transaction remains
-
-
-def test_repository_transactions_lazy_initialization(
-    repository: YNABRepository,
-) -> None:
-    """Test transactions repository initializes automatically when data requested."""
-    txn1 = create_ynab_transaction(id="txn-1", amount=-25_000, memo="Groceries")
-
-    transactions_response = ynab.TransactionsResponse(
-        data=ynab.TransactionsResponseData(transactions=[txn1], server_knowledge=100)
-    )
-
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_transactions_api = MagicMock()
-        mock_transactions_api.get_transactions.return_value = transactions_response
-
-        with patch("ynab.TransactionsApi", return_value=mock_transactions_api):
-            # Repository transactions is not initialized initially
-            assert "transactions" not in repository._data
-
-            # Calling get_transactions should trigger sync
-            transactions = repository.get_transactions()
-
-    # Verify sync was called
-    mock_transactions_api.get_transactions.assert_called_once()
-
-    # Verify data is available
-    assert len(transactions) == 1
-    assert transactions[0].id == "txn-1"
-
-
 # ===== EDGE CASE AND ERROR HANDLING TESTS =====
 
 
@@ -781,7 +338,9 @@ def test_repository_needs_sync_functionality(repository: YNABRepository) -> None
     assert repository.needs_sync(max_age_minutes=2)
 
 
-def test_repository_conflict_exception_fallback(repository: YNABRepository) -> None:
+def test_repository_conflict_exception_fallback(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that ConflictException triggers fallback to full sync."""
     repository._server_knowledge["accounts"] = 100
     repository._last_sync = datetime.now()
@@ -791,20 +350,15 @@ def test_repository_conflict_exception_fallback(repository: YNABRepository) -> N
         data=ynab.AccountsResponseData(accounts=[account1], server_knowledge=120)
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        # First call (delta) raises ConflictException (409)
-        # Second call (full refresh) succeeds
-        mock_accounts_api.get_accounts.side_effect = [
-            ConflictException(status=409, reason="Conflict"),
-            full_response,
-        ]
+    mock_accounts_api = ynab_apis.accounts_api
+    # First call (delta) raises ConflictException (409)
+    # Second call (full refresh) succeeds
+    mock_accounts_api.get_accounts.side_effect = [
+        ConflictException(status=409, reason="Conflict"),
+        full_response,
+    ]
 
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
+    repository.sync_accounts()
 
     # Verify fallback behavior
     assert mock_accounts_api.get_accounts.call_count == 2
@@ -813,27 +367,24 @@ def test_repository_conflict_exception_fallback(repository: YNABRepository) -> N
     assert repository._server_knowledge["accounts"] == 120
 
 
-def test_repository_rate_limit_retry_behavior(repository: YNABRepository) -> None:
+def test_repository_rate_limit_retry_behavior(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that 429 rate limit triggers retry with exponential backoff."""
     account1 = create_ynab_account(id="acc-1", name="Checking")
     success_response = ynab.AccountsResponse(
         data=ynab.AccountsResponseData(accounts=[account1], server_knowledge=100)
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    # First call raises 429, second call succeeds
+    mock_accounts_api.get_accounts.side_effect = [
+        ynab.ApiException(status=429, reason="Too Many Requests"),
+        success_response,
+    ]
 
-        mock_accounts_api = MagicMock()
-        # First call raises 429, second call succeeds
-        mock_accounts_api.get_accounts.side_effect = [
-            ynab.ApiException(status=429, reason="Too Many Requests"),
-            success_response,
-        ]
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            with patch("time.sleep") as mock_sleep:
-                repository.sync_accounts()
+    with patch("time.sleep") as mock_sleep:
+        repository.sync_accounts()
 
     # Verify retry behavior
     assert mock_accounts_api.get_accounts.call_count == 2
@@ -842,22 +393,19 @@ def test_repository_rate_limit_retry_behavior(repository: YNABRepository) -> Non
     assert len(accounts) == 1
 
 
-def test_repository_rate_limit_max_retries_exceeded(repository: YNABRepository) -> None:
+def test_repository_rate_limit_max_retries_exceeded(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that repeated 429s eventually give up after max retries."""
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        # Always return 429
-        mock_accounts_api.get_accounts.side_effect = ynab.ApiException(
-            status=429, reason="Too Many Requests"
-        )
+    mock_accounts_api = ynab_apis.accounts_api
+    # Always return 429
+    mock_accounts_api.get_accounts.side_effect = ynab.ApiException(
+        status=429, reason="Too Many Requests"
+    )
 
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            with patch("time.sleep") as mock_sleep:
-                with pytest.raises(ynab.ApiException) as exc_info:
-                    repository.sync_accounts()
+    with patch("time.sleep") as mock_sleep:
+        with pytest.raises(ynab.ApiException) as exc_info:
+            repository.sync_accounts()
 
     # Verify max retries behavior (3 attempts total)
     assert mock_accounts_api.get_accounts.call_count == 3
@@ -866,19 +414,16 @@ def test_repository_rate_limit_max_retries_exceeded(repository: YNABRepository)
     assert mock_sleep.call_count == 2
 
 
-def test_repository_unexpected_exception_not_caught(repository: YNABRepository) -> None:
+def test_repository_unexpected_exception_not_caught(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that unexpected exceptions are re-raised, not silently caught."""
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    # Raise a non-API exception
+    mock_accounts_api.get_accounts.side_effect = ValueError("Unexpected error")
 
-        mock_accounts_api = MagicMock()
-        # Raise a non-API exception
-        mock_accounts_api.get_accounts.side_effect = ValueError("Unexpected error")
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            with pytest.raises(ValueError) as exc_info:
-                repository.sync_accounts()
+    with pytest.raises(ValueError) as exc_info:
+        repository.sync_accounts()
 
     assert str(exc_info.value) == "Unexpected error"
 
@@ -1019,25 +564,22 @@ def test_repository_concurrent_access_error_handling(
     assert str(errors[0]) == "Test error for coverage"
 
 
-def test_repository_lazy_init_only_syncs_once(repository: YNABRepository) -> None:
+def test_repository_lazy_init_only_syncs_once(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that lazy initialization only syncs once even with concurrent access."""
     account1 = create_ynab_account(id="acc-1", name="Checking")
     success_response = ynab.AccountsResponse(
         data=ynab.AccountsResponseData(accounts=[account1], server_knowledge=100)
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.return_value = success_response
 
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = success_response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            # Multiple calls to get_accounts should only sync once
-            accounts1 = repository.get_accounts()
-            accounts2 = repository.get_accounts()
-            accounts3 = repository.get_accounts()
+    # Multiple calls to get_accounts should only sync once
+    accounts1 = repository.get_accounts()
+    accounts2 = repository.get_accounts()
+    accounts3 = repository.get_accounts()
 
     # Verify only one API call was made
     mock_accounts_api.get_accounts.assert_called_once()
@@ -1046,21 +588,18 @@ def test_repository_lazy_init_only_syncs_once(repository: YNABRepository) -> Non
     assert len(accounts1) == len(accounts2) == len(accounts3) == 1
 
 
-def test_repository_handles_empty_api_responses(repository: YNABRepository) -> None:
+def test_repository_handles_empty_api_responses(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test repository gracefully handles empty API responses."""
     empty_response = ynab.AccountsResponse(
         data=ynab.AccountsResponseData(accounts=[], server_knowledge=100)
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = empty_response
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.return_value = empty_response
 
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
+    repository.sync_accounts()
 
     # Should handle empty response gracefully
     accounts = repository.get_accounts()
@@ -1069,7 +608,9 @@ def test_repository_handles_empty_api_responses(repository: YNABRepository) -> N
     assert repository.is_initialized()
 
 
-def test_repository_server_knowledge_progression(repository: YNABRepository) -> None:
+def test_repository_server_knowledge_progression(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that server knowledge progresses correctly through multiple syncs."""
     account1 = create_ynab_account(id="acc-1", name="Checking")
 
@@ -1086,21 +627,16 @@ def test_repository_server_knowledge_progression(repository: YNABRepository) ->
         )
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.side_effect = [response1, response2]
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.side_effect = [response1, response2]
 
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            # First sync
-            repository.sync_accounts()
-            assert repository._server_knowledge["accounts"] == 100
+    # First sync
+    repository.sync_accounts()
+    assert repository._server_knowledge["accounts"] == 100
 
-            # Second sync should use previous knowledge
-            repository.sync_accounts()
-            assert repository._server_knowledge["accounts"] == 110
+    # Second sync should use previous knowledge
+    repository.sync_accounts()
+    assert repository._server_knowledge["accounts"] == 110
 
     # Verify second call used delta sync
     calls = mock_accounts_api.get_accounts.call_args_list
@@ -1111,7 +647,9 @@ def test_repository_server_knowledge_progression(repository: YNABRepository) ->
     }  # Second call with knowledge
 
 
-def test_repository_mixed_entity_types_independent(repository: YNABRepository) -> None:
+def test_repository_mixed_entity_types_independent(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that different entity types sync independently."""
     # Set up different sync states for different entity types
     account1 = create_ynab_account(id="acc-1", name="Checking")
@@ -1124,23 +662,15 @@ def test_repository_mixed_entity_types_independent(repository: YNABRepository) -
         data=ynab.PayeesResponseData(payees=[payee1], server_knowledge=200)
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = accounts_response
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.return_value = accounts_response
 
-        mock_payees_api = MagicMock()
-        mock_payees_api.get_payees.return_value = payees_response
+    mock_payees_api = ynab_apis.payees_api
+    mock_payees_api.get_payees.return_value = payees_response
 
-        with (
-            patch("ynab.AccountsApi", return_value=mock_accounts_api),
-            patch("ynab.PayeesApi", return_value=mock_payees_api),
-        ):
-            # Sync different entity types
-            repository.sync_accounts()
-            repository.sync_payees()
+    # Sync different entity types
+    repository.sync_accounts()
+    repository.sync_payees()
 
     # Verify independent server knowledge tracking
     assert repository._server_knowledge["accounts"] == 100
@@ -1191,7 +721,7 @@ def test_repository_background_sync_thread_safety(repository: YNABRepository) ->
 
 
 def test_repository_preserves_data_during_failed_sync(
-    repository: YNABRepository,
+    repository: YNABRepository, ynab_apis: SimpleNamespace
 ) -> None:
     """Test that existing data is preserved when sync fails."""
     # Set up initial good data
@@ -1201,18 +731,13 @@ def test_repository_preserves_data_during_failed_sync(
     repository._last_sync = datetime.now()
 
     # Mock sync to fail
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.side_effect = ynab.ApiException(
-            status=500, reason="Server Error"
-        )
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.side_effect = ynab.ApiException(
+        status=500, reason="Server Error"
+    )
 
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            with pytest.raises(ynab.ApiException):
-                repository.sync_accounts()
+    with pytest.raises(ynab.ApiException):
+        repository.sync_accounts()
 
     # Original data should still be there
     accounts = repository.get_accounts()
@@ -1221,27 +746,26 @@ def test_repository_preserves_data_during_failed_sync(
     assert repository._server_knowledge["accounts"] == 100
 
 
-def test_repository_handles_malformed_api_responses(repository: YNABRepository) -> None:
+def test_repository_handles_malformed_api_responses(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test repository handles malformed or unexpected API response structures."""
     # Mock a response that might have unexpected structure
-    malformed_response = MagicMock()
+    malformed_response = Mock()
     malformed_response.data.accounts = None  # Unexpected None
     malformed_response.data.server_knowledge = 100
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.return_value = malformed_response
 
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = malformed_response
+    # Should handle malformed response gracefully
+    with pytest.raises((AttributeError, TypeError)):
+        repository.sync_accounts()
 
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            # Should handle malformed response gracefully
-            with pytest.raises((AttributeError, TypeError)):
-                repository.sync_accounts()
 
-
-def test_repository_sync_entity_atomic_updates(repository: YNABRepository) -> None:
+def test_repository_sync_entity_atomic_updates(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that _sync_entity updates are atomic."""
     # Set up initial data
     account1 = create_ynab_account(id="acc-1", name="Checking")
@@ -1257,21 +781,16 @@ def test_repository_sync_entity_atomic_updates(repository: YNABRepository) -> No
         )
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.return_value = success_response
 
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = success_response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            # Mock _apply_deltas to fail
-            with patch.object(
-                repository, "_apply_deltas", side_effect=Exception("Delta failed")
-            ):
-                # Sync should fail
-                with pytest.raises(Exception, match="Delta failed"):
-                    repository.sync_accounts()
+    # Mock _apply_deltas to fail
+    with patch.object(
+        repository, "_apply_deltas", side_effect=Exception("Delta failed")
+    ):
+        # Sync should fail
+        with pytest.raises(Exception, match="Delta failed"):
+            repository.sync_accounts()
 
     # Original data should be unchanged due to atomic failure
     accounts = repository.get_accounts()
@@ -1281,7 +800,7 @@ def test_repository_sync_entity_atomic_updates(repository: YNABRepository) -> No
 
 
 def test_repository_handles_very_large_server_knowledge_values(
-    repository: YNABRepository,
+    repository: YNABRepository, ynab_apis: SimpleNamespace
 ) -> None:
     """Test repository handles very large server knowledge values correctly."""
     # Test with a very large server knowledge value
@@ -1294,29 +813,16 @@ def test_repository_handles_very_large_server_knowledge_values(
         )
     )
 
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_accounts_api = ynab_apis.accounts_api
+    mock_accounts_api.get_accounts.return_value = response
 
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
+    repository.sync_accounts()
 
     # Should handle large values correctly
     assert repository._server_knowledge["accounts"] == large_knowledge
 
     # Should be able to use it in subsequent delta calls
-    with patch("ynab.ApiClient") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        mock_accounts_api = MagicMock()
-        mock_accounts_api.get_accounts.return_value = response
-
-        with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-            repository.sync_accounts()
+    repository.sync_accounts()
 
     # Verify large knowledge was passed correctly
     mock_accounts_api.get_accounts.assert_called_with(
@@ -1345,7 +851,9 @@ def test_repository_background_sync_respects_staleness_threshold(
         mock_bg_sync.assert_not_called()
 
 
-def test_repository_error_logging_behavior(repository: YNABRepository) -> None:
+def test_repository_error_logging_behavior(
+    repository: YNABRepository, ynab_apis: SimpleNamespace
+) -> None:
     """Test that errors are properly logged with appropriate levels."""
 
     # Capture log messages
@@ -1362,39 +870,33 @@ def test_repository_error_logging_behavior(repository: YNABRepository) -> None:
     repository_logger.setLevel(logging.DEBUG)
 
     try:
-        with patch("ynab.ApiClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
-
-            mock_accounts_api = MagicMock()
-
-            # Set up initial server knowledge to trigger delta sync path
-            repository._server_knowledge["accounts"] = 50
-
-            # Test different error scenarios
-            # 1. ConflictException should log as INFO (expected)
-            mock_accounts_api.get_accounts.side_effect = [
-                ConflictException(status=409, reason="Conflict"),
-                ynab.AccountsResponse(
-                    data=ynab.AccountsResponseData(accounts=[], server_knowledge=100)
-                ),
-            ]
-
-            with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-                repository.sync_accounts()
-
-            # 2. Generic ApiException should log as WARNING
-            # Reset server knowledge for next test
-            repository._server_knowledge["accounts"] = 60
-            mock_accounts_api.get_accounts.side_effect = [
-                ynab.ApiException(status=500, reason="Server Error"),
-                ynab.AccountsResponse(
-                    data=ynab.AccountsResponseData(accounts=[], server_knowledge=100)
-                ),
-            ]
-
-            with patch("ynab.AccountsApi", return_value=mock_accounts_api):
-                repository.sync_accounts()
+        mock_accounts_api = ynab_apis.accounts_api
+
+        # Set up initial server knowledge to trigger delta sync path
+        repository._server_knowledge["accounts"] = 50
+
+        # Test different error scenarios
+        # 1. ConflictException should log as INFO (expected)
+        mock_accounts_api.get_accounts.side_effect = [
+            ConflictException(status=409, reason="Conflict"),
+            ynab.AccountsResponse(
+                data=ynab.AccountsResponseData(accounts=[], server_knowledge=100)
+            ),
+        ]
+
+        repository.sync_accounts()
+
+        # 2. Generic ApiException should log as WARNING
+        # Reset server knowledge for next test
+        repository._server_knowledge["accounts"] = 60
+        mock_accounts_api.get_accounts.side_effect = [
+            ynab.ApiException(status=500, reason="Server Error"),
+            ynab.AccountsResponse(
+                data=ynab.AccountsResponseData(accounts=[], server_knowledge=100)
+            ),
+        ]
+
+        repository.sync_accounts()
 
         # Verify appropriate log levels were used
         info_logs = [msg for level, msg in log_messages if level == "INFO"]
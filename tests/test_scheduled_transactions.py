@@ -5,15 +5,17 @@ Tests the list_scheduled_transactions tool with various filters and scenarios.
 """
 
 from datetime import date
-from unittest.mock import MagicMock
+from unittest.mock import NonCallableMock, patch
 
 import ynab
 from assertions import extract_response_data
 from fastmcp.client import Client, FastMCPTransport
 
+import server
+
 
 async def test_list_scheduled_transactions_basic(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test basic scheduled transaction listing without filters."""
@@ -112,7 +114,7 @@ async def test_list_scheduled_transactions_basic(
 
 
 async def test_list_scheduled_transactions_with_frequency_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing filtered by frequency."""
@@ -181,7 +183,7 @@ async def test_list_scheduled_transactions_with_frequency_filter(
 
 
 async def test_list_scheduled_transactions_with_upcoming_days_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing filtered by upcoming days."""
@@ -232,10 +234,6 @@ async def test_list_scheduled_transactions_with_upcoming_days_filter(
     mock_repository.get_scheduled_transactions.return_value = [st_soon, st_later]
 
     # Mock datetime.now() to return a fixed date for testing
-    from unittest.mock import patch
-
-    import server
-
     with patch.object(server, "datetime") as mock_datetime:
         mock_datetime.now.return_value.date.return_value = date(2024, 1, 15)
 
@@ -253,7 +251,7 @@ async def test_list_scheduled_transactions_with_upcoming_days_filter(
 
 
 async def test_list_scheduled_transactions_with_amount_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing filtered by amount range."""
@@ -315,7 +313,7 @@ async def test_list_scheduled_transactions_with_amount_filter(
 
 
 async def test_list_scheduled_transactions_with_account_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing filtered by account."""
@@ -377,7 +375,7 @@ async def test_list_scheduled_transactions_with_account_filter(
 
 
 async def test_list_scheduled_transactions_with_category_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing filtered by category."""
@@ -442,7 +440,7 @@ async def test_list_scheduled_transactions_with_category_filter(
 
 
 async def test_list_scheduled_transactions_with_min_amount_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing filtered by minimum amount."""
@@ -504,7 +502,7 @@ async def test_list_scheduled_transactions_with_min_amount_filter(
 
 
 async def test_list_scheduled_transactions_with_payee_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing filtered by payee."""
@@ -566,7 +564,7 @@ async def test_list_scheduled_transactions_with_payee_filter(
 
 
 async def test_list_scheduled_transactions_pagination(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing with pagination."""
@@ -624,7 +622,7 @@ async def test_list_scheduled_transactions_pagination(
 
 
 async def test_list_scheduled_transactions_with_subtransactions(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing with split transactions (subtransactions)."""
@@ -704,7 +702,7 @@ async def test_list_scheduled_transactions_with_subtransactions(
 
 
 async def test_list_scheduled_transactions_with_deleted_subtransactions(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test scheduled transaction listing excludes deleted subtransactions."""
@@ -3,7 +3,7 @@ Tests for transaction-related functionality in YNAB MCP Server.
 """
 
 from datetime import date
-from unittest.mock import MagicMock
+from unittest.mock import NonCallableMock
 
 import pytest
 import ynab
@@ -11,10 +11,11 @@ from assertions import extract_response_data
 from conftest import create_ynab_transaction
 from fastmcp.client import Client, FastMCPTransport
 from fastmcp.exceptions import ToolError
+from ynab.models.hybrid_transaction import HybridTransaction
 
 
 async def test_list_transactions_basic(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test basic transaction listing without filters."""
 
@@ -86,7 +87,7 @@ async def test_list_transactions_basic(
 
 
 async def test_list_transactions_with_account_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test transaction listing filtered by account."""
@@ -124,9 +125,22 @@ async def test_list_transactions_with_account_filter(
     )
 
 
+@pytest.mark.parametrize(
+    ("amount_filters", "expected_ids"),
+    [
+        # Transactions >= -$50 only include the small one (-$25)
+        ({"min_amount": -50.0}, ["txn-small"]),
+        # Transactions <= -$100 only include the large one (-$120)
+        ({"max_amount": -100.0}, ["txn-large"]),
+        # Transactions between -$80 and -$40 only include the medium one (-$60)
+        ({"min_amount": -80.0, "max_amount": -40.0}, ["txn-medium"]),
+    ],
+)
 async def test_list_transactions_with_amount_filters(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
+    amount_filters: dict[str, float],
+    expected_ids: list[str],
 ) -> None:
     """Test transaction listing with amount range filters."""
     # Create transactions with different amounts
@@ -166,52 +180,15 @@ async def test_list_transactions_with_amount_filters(
     # Mock repository to return all transactions for filtering
     mock_repository.get_transactions.return_value = [txn_small, txn_medium, txn_large]
 
-    # Test with min_amount filter (transactions >= -$50)
-    result = await mcp_client.call_tool(
-        "list_transactions",
-        {
-            "min_amount": -50.0  # -$50
-        },
-    )
-
-    response_data = extract_response_data(result)
-    assert response_data is not None
-    # Should only include small transaction (-$25 > -$50)
-    assert len(response_data["transactions"]) == 1
-    assert response_data["transactions"][0]["id"] == "txn-small"
-
-    # Test with max_amount filter (transactions <= -$100)
-    result = await mcp_client.call_tool(
-        "list_transactions",
-        {
-            "max_amount": -100.0  # -$100
-        },
-    )
+    result = await mcp_client.call_tool("list_transactions", amount_filters)
 
     response_data = extract_response_data(result)
-    assert response_data is not None
-    # Should only include large transaction (-$120 < -$100)
-    assert len(response_data["transactions"]) == 1
-    assert response_data["transactions"][0]["id"] == "txn-large"
-
-    # Test with both min and max filters
-    result = await mcp_client.call_tool(
-        "list_transactions",
-        {
-            "min_amount": -80.0,  # >= -$80
-            "max_amount": -40.0,  # <= -$40
-        },
-    )
-
-    response_data = extract_response_data(result)
-    assert response_data is not None
-    # Should only include medium transaction (-$60)
-    assert len(response_data["transactions"]) == 1
-    assert response_data["transactions"][0]["id"] == "txn-medium"
+    assert [txn["id"] for txn in response_data["transactions"]] == expected_ids
+    mock_repository.get_transactions.assert_called_once_with()
 
 
 async def test_list_transactions_with_subtransactions(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test transaction listing with split transactions (subtransactions)."""
     sub1 = ynab.SubTransaction(
@@ -276,7 +253,6 @@ async def test_list_transactions_with_subtransactions(
     result = await mcp_client.call_tool("list_transactions", {})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["transactions"]) == 1
 
     txn = response_data["transactions"][0]
@@ -294,7 +270,7 @@ async def test_list_transactions_with_subtransactions(
 
 
 async def test_list_transactions_pagination(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test transaction listing with pagination."""
     # Create many transactions to test pagination
@@ -319,7 +295,6 @@ async def test_list_transactions_pagination(
     result = await mcp_client.call_tool("list_transactions", {"limit": 2, "offset": 0})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["transactions"]) == 2
     assert response_data["pagination"]["total_count"] == 5
     assert response_data["pagination"]["has_more"] is True
@@ -332,14 +307,13 @@ async def test_list_transactions_pagination(
     result = await mcp_client.call_tool("list_transactions", {"limit": 2, "offset": 2})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["transactions"]) == 2
     assert response_data["transactions"][0]["id"] == "txn-2"
     assert response_data["transactions"][1]["id"] == "txn-1"
 
 
 async def test_list_transactions_with_category_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test transaction listing filtered by category."""
@@ -377,7 +351,7 @@ async def test_list_transactions_with_category_filter(
 
 
 async def test_list_transactions_with_payee_filter(
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test transaction listing filtered by payee."""
@@ -414,7 +388,7 @@ async def test_list_transactions_with_payee_filter(
 
 
 async def test_split_transaction_payee_inheritance(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test that subtransactions inherit parent payee when their payee is null."""
     # Create subtransactions where payee is null (simulating API response issue)
@@ -465,7 +439,6 @@ async def test_split_transaction_payee_inheritance(
     result = await mcp_client.call_tool("list_transactions", {})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["transactions"]) == 1
 
     txn = response_data["transactions"][0]
@@ -486,14 +459,10 @@ async def test_split_transaction_payee_inheritance(
 
 
 async def test_hybrid_transaction_subtransaction_payee_resolution(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test HybridTransaction subtransactions that need parent payee resolution."""
     # Create a HybridTransaction subtransaction (like from filtered API)
-    from datetime import date
-
-    from ynab.models.hybrid_transaction import HybridTransaction
-
     # This simulates what we get from get_transactions_by_filters()
     hybrid_subtxn = HybridTransaction(
         id="28a0ce46-a33b-4c3b-bcfc-633a05d9f9ec",
@@ -543,7 +512,6 @@ async def test_hybrid_transaction_subtransaction_payee_resolution(
     )
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["transactions"]) == 1
 
     txn = response_data["transactions"][0]
@@ -559,13 +527,9 @@ async def test_hybrid_transaction_subtransaction_payee_resolution(
 
 
 async def test_hybrid_transaction_with_missing_parent(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test HybridTransaction subtransaction when parent is not found."""
-    from datetime import date
-
-    from ynab.models.hybrid_transaction import HybridTransaction
-
     # Create a HybridTransaction subtransaction with non-existent parent
     hybrid_subtxn = HybridTransaction(
         id="orphan-subtxn",
@@ -607,13 +571,9 @@ async def test_hybrid_transaction_with_missing_parent(
 
 
 async def test_hybrid_transaction_parent_resolver_exception(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test HybridTransaction when parent resolver throws exception."""
-    from datetime import date
-
-    from ynab.models.hybrid_transaction import HybridTransaction
-
     hybrid_subtxn = HybridTransaction(
         id="exception-subtxn",
         date=date(2025, 8, 11),
@@ -652,13 +612,9 @@ async def test_hybrid_transaction_parent_resolver_exception(
 
 
 async def test_hybrid_transaction_parent_with_null_payee(
-    mock_repository: MagicMock, mcp_client: Client[FastMCPTransport]
+    mock_repository: NonCallableMock, mcp_client: Client[FastMCPTransport]
 ) -> None:
     """Test HybridTransaction when parent transaction also has null payee."""
-    from datetime import date
-
-    from ynab.models.hybrid_transaction import HybridTransaction
-
     hybrid_subtxn = HybridTransaction(
         id="null-payee-subtxn",
         date=date(2025, 8, 11),
@@ -707,7 +663,6 @@ async def test_hybrid_transaction_parent_with_null_payee(
     result = await mcp_client.call_tool("list_transactions", {"category_id": "cat-1"})
 
     response_data = extract_response_data(result)
-    assert response_data is not None
     assert len(response_data["transactions"]) == 1
 
     txn = response_data["transactions"][0]
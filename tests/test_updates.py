@@ -5,91 +5,22 @@ Tests the update_category_budget and update_transaction tools.
 """
 
 from datetime import date
-from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import Mock, NonCallableMock
 
 import ynab
 from assertions import extract_response_data
+from conftest import (
+    create_ynab_category,
+    create_ynab_category_group,
+    create_ynab_transaction,
+)
 from fastmcp.client import Client, FastMCPTransport
 
 
-def create_ynab_category(
-    *,
-    id: str = "cat-1",
-    category_group_id: str = "group-1",
-    budgeted: int = 100_000,  # $100.00
-    activity: int = -50_000,  # -$50.00
-    balance: int = 50_000,  # $50.00
-    **kwargs: Any,
-) -> ynab.Category:
-    """Create a YNAB Category for testing with sensible defaults."""
-    return ynab.Category(
-        id=id,
-        category_group_id=category_group_id,
-        category_group_name=kwargs.get("category_group_name", "Test Group"),
-        name=kwargs.get("name", "Test Category"),
-        hidden=kwargs.get("hidden", False),
-        original_category_group_id=kwargs.get("original_category_group_id"),
-        note=kwargs.get("note"),
-        budgeted=budgeted,
-        activity=activity,
-        balance=balance,
-        goal_type=kwargs.get("goal_type"),
-        goal_needs_whole_amount=kwargs.get("goal_needs_whole_amount"),
-        goal_day=kwargs.get("goal_day"),
-        goal_cadence=kwargs.get("goal_cadence"),
-        goal_cadence_frequency=kwargs.get("goal_cadence_frequency"),
-        goal_creation_month=kwargs.get("goal_creation_month"),
-        goal_target=kwargs.get("goal_target"),
-        goal_target_month=kwargs.get("goal_target_month"),
-        goal_percentage_complete=kwargs.get("goal_percentage_complete"),
-        goal_months_to_budget=kwargs.get("goal_months_to_budget"),
-        goal_under_funded=kwargs.get("goal_under_funded"),
-        goal_overall_funded=kwargs.get("goal_overall_funded"),
-        goal_overall_left=kwargs.get("goal_overall_left"),
-        deleted=kwargs.get("deleted", False),
-    )
-
-
-def create_ynab_transaction_detail(
-    *,
-    id: str = "txn-1",
-    date: date = date(2024, 1, 15),
-    amount: int = -50_000,  # -$50.00
-    account_id: str = "acc-1",
-    **kwargs: Any,
-) -> ynab.TransactionDetail:
-    """Create a YNAB TransactionDetail for testing with sensible defaults."""
-    return ynab.TransactionDetail(
-        id=id,
-        date=date,
-        amount=amount,
-        memo=kwargs.get("memo"),
-        cleared=kwargs.get("cleared", ynab.TransactionClearedStatus.CLEARED),
-        approved=kwargs.get("approved", True),
-        flag_color=kwargs.get("flag_color"),
-        account_id=account_id,
-        account_name=kwargs.get("account_name", "Test Account"),
-        payee_id=kwargs.get("payee_id"),
-        payee_name=kwargs.get("payee_name"),
-        category_id=kwargs.get("category_id"),
-        category_name=kwargs.get("category_name"),
-        transfer_account_id=kwargs.get("transfer_account_id"),
-        transfer_transaction_id=kwargs.get("transfer_transaction_id"),
-        matched_transaction_id=kwargs.get("matched_transaction_id"),
-        import_id=kwargs.get("import_id"),
-        import_payee_name=kwargs.get("import_payee_name"),
-        import_payee_name_original=kwargs.get("import_payee_name_original"),
-        debt_transaction_type=kwargs.get("debt_transaction_type"),
-        deleted=kwargs.get("deleted", False),
-        subtransactions=kwargs.get("subtransactions", []),
-    )
-
-
 async def test_update_category_budget_success(
     mock_environment_variables: None,
-    categories_api: MagicMock,
-    mock_repository: MagicMock,
+    categories_api: Mock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test successful category budget update."""
@@ -108,11 +39,9 @@ async def test_update_category_budget_success(
     mock_repository.update_month_category.return_value = updated_category
 
     # Mock the categories response for group names
-    category_group = ynab.CategoryGroupWithCategories(
+    category_group = create_ynab_category_group(
         id="group-everyday",
         name="Everyday Expenses",
-        hidden=False,
-        deleted=False,
         categories=[updated_category],
     )
 
@@ -149,15 +78,15 @@ async def test_update_category_budget_success(
 
 async def test_update_transaction_success(
     mock_environment_variables: None,
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test successful transaction update."""
 
     # Create the updated transaction that will be returned
-    updated_transaction = create_ynab_transaction_detail(
+    updated_transaction = create_ynab_transaction(
         id="txn-123",
-        date=date(2024, 1, 15),
+        transaction_date=date(2024, 1, 15),
         amount=-75_000,  # -$75.00
         account_id="acc-checking",
         account_name="Checking",
@@ -171,9 +100,9 @@ async def test_update_transaction_success(
     )
 
     # Mock the existing transaction response (what we fetch before updating)
-    original_transaction = create_ynab_transaction_detail(
+    original_transaction = create_ynab_transaction(
         id="txn-123",
-        date=date(2024, 1, 15),
+        transaction_date=date(2024, 1, 15),
         amount=-75_000,  # -$75.00
         account_id="acc-checking",
         account_name="Checking",
@@ -217,7 +146,7 @@ async def test_update_transaction_success(
 
 async def test_update_category_budget_with_specific_month(
     mock_environment_variables: None,
-    categories_api: MagicMock,
+    categories_api: Mock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test category budget update for a specific month."""
@@ -236,11 +165,9 @@ async def test_update_category_budget_with_specific_month(
     categories_api.update_month_category.return_value = save_response
 
     # Mock categories response for group names
-    category_group = ynab.CategoryGroupWithCategories(
+    category_group = create_ynab_category_group(
         id="group-1",
         name="Fun Money",
-        hidden=False,
-        deleted=False,
         categories=[updated_category],
     )
     categories_response = ynab.CategoriesResponse(
@@ -272,19 +199,19 @@ async def test_update_category_budget_with_specific_month(
 
 async def test_update_transaction_minimal_fields(
     mock_environment_variables: None,
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test transaction update with only category change."""
 
     # Mock the existing transaction response (what we fetch before updating)
-    original_transaction = create_ynab_transaction_detail(
+    original_transaction = create_ynab_transaction(
         id="txn-456",
         category_id="cat-food",
         category_name="Food",
     )
 
-    updated_transaction = create_ynab_transaction_detail(
+    updated_transaction = create_ynab_transaction(
         id="txn-456",
         category_id="cat-gas",
         category_name="Gas & Fuel",
@@ -314,13 +241,13 @@ async def test_update_transaction_minimal_fields(
 
 async def test_update_transaction_with_payee(
     mock_environment_variables: None,
-    mock_repository: MagicMock,
+    mock_repository: NonCallableMock,
     mcp_client: Client[FastMCPTransport],
 ) -> None:
     """Test transaction update with payee_id to cover all branches."""
 
     # Mock the existing transaction response (what we fetch before updating)
-    original_transaction = create_ynab_transaction_detail(
+    original_transaction = create_ynab_transaction(
         id="txn-789",
         amount=-25_500,  # -$25.50
         payee_id="payee-generic",
@@ -328,7 +255,7 @@ async def test_update_transaction_with_payee(
         memo="Store purchase",
     )
 
-    updated_transaction = create_ynab_transaction_detail(
+    updated_transaction = create_ynab_transaction(
         id="txn-789",
         amount=-25_500,  # -$25.50
         payee_id="payee-starbucks",
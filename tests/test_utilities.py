@@ -4,11 +4,15 @@ Test utility functions in server module.
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Any
 from unittest.mock import patch
 
 import pytest
+import ynab
+from conftest import create_ynab_category
 
 import server
+from models import Transaction, milliunits_to_currency
 
 
 def test_decimal_precision_milliunits_conversion() -> None:
@@ -26,8 +30,6 @@ def test_decimal_precision_milliunits_conversion() -> None:
     ]
 
     for milliunits, expected in test_cases:
-        from models import milliunits_to_currency
-
         result = milliunits_to_currency(milliunits)
         assert result == expected, (
             f"Failed for {milliunits}: got {result}, expected {expected}"
@@ -40,35 +42,25 @@ def test_decimal_precision_milliunits_conversion() -> None:
 
 def test_milliunits_to_currency_valid_input() -> None:
     """Test milliunits conversion with valid input."""
-    from models import milliunits_to_currency
-
     result = milliunits_to_currency(123456)
     assert result == Decimal("123.456")
 
 
 def test_milliunits_to_currency_none_input() -> None:
     """Test milliunits conversion with None input raises TypeError."""
-    from typing import Any
-
     with pytest.raises(TypeError):
-        from models import milliunits_to_currency
-
         none_value: Any = None
         milliunits_to_currency(none_value)
 
 
 def test_milliunits_to_currency_zero() -> None:
     """Test milliunits conversion with zero."""
-    from models import milliunits_to_currency
-
     result = milliunits_to_currency(0)
     assert result == Decimal("0")
 
 
 def test_milliunits_to_currency_negative() -> None:
     """Test milliunits conversion with negative value."""
-    from models import milliunits_to_currency
-
     result = milliunits_to_currency(-50000)
     assert result == Decimal("-50")
 
@@ -124,19 +116,47 @@ def test_convert_month_to_date_with_last_and_next() -> None:
 
 def test_convert_month_to_date_invalid_value() -> None:
     """Test convert_month_to_date with invalid value raises error."""
-    from typing import Any
-
     with pytest.raises(ValueError, match="Invalid month value: invalid"):
         invalid_value: Any = "invalid"
         server.convert_month_to_date(invalid_value)
 
 
-def test_convert_transaction_to_model_basic() -> None:
-    """Test Transaction.from_ynab with basic transaction."""
-    import ynab
+@pytest.mark.parametrize(
+    ("hidden", "deleted", "expected_ids"),
+    [
+        pytest.param(False, False, ["cat-active", "cat-flagged"], id="active"),
+        pytest.param(True, False, ["cat-active"], id="hidden"),
+        pytest.param(False, True, ["cat-active"], id="deleted"),
+        pytest.param(True, True, ["cat-active"], id="hidden_and_deleted"),
+    ],
+)
+def test_filter_active_items_excludes_deleted_and_hidden(
+    hidden: bool, deleted: bool, expected_ids: list[str]
+) -> None:
+    """Test that _filter_active_items drops deleted and hidden categories."""
+    categories = [
+        create_ynab_category(id="cat-active"),
+        create_ynab_category(id="cat-flagged", hidden=hidden, deleted=deleted),
+    ]
+
+    active_categories = server._filter_active_items(categories, exclude_hidden=True)
 
-    from models import Transaction
+    assert [category.id for category in active_categories] == expected_ids
 
+
+def test_paginate_items_returns_a_copy_of_a_single_page() -> None:
+    """Test that a page holding every item is a copy, not the caller's list."""
+    items = ["a", "b"]
+
+    page, pagination = server._paginate_items(items, limit=10, offset=0)
+
+    assert page == items
+    assert page is not items
+    assert pagination.has_more is False
+
+
+def test_convert_transaction_to_model_basic() -> None:
+    """Test Transaction.from_ynab with basic transaction."""
     txn = ynab.TransactionDetail(
         id="txn-123",
         date=date(2024, 6, 15),
@@ -175,10 +195,6 @@ def test_convert_transaction_to_model_basic() -> None:
 
 def test_convert_transaction_to_model_without_optional_attributes() -> None:
     """Test Transaction.from_ynab with minimal TransactionDetail."""
-    import ynab
-
-    from models import Transaction
-
     minimal_txn = ynab.TransactionDetail(
         id="txn-456",
         date=date(2024, 6, 16),
@@ -214,8 +230,6 @@ def test_convert_transaction_to_model_without_optional_attributes() -> None:
 
 def test_milliunits_to_currency_from_models() -> None:
     """Test milliunits_to_currency function from models module."""
-    from models import milliunits_to_currency
-
     assert milliunits_to_currency(50000) == Decimal("50")
     assert milliunits_to_currency(-25000) == Decimal("-25")
     assert milliunits_to_currency(1000) == Decimal("1")